@@ -1,11 +1,102 @@
 import cv2
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+def _probe_camera(i, device_names):
+    """
+    Try to open camera index i with each backend in turn
+    Returns a dict describing the camera, or None if no backend could open it
+    """
+    # Try multiple backends to ensure we catch virtual cameras
+    # First try DirectShow on Windows
+    connected = False
+    frame_read = False
+    backend_used = None
+    
+    # Try multiple backends in order of reliability
+    backends = [
+        (cv2.CAP_DSHOW, "DirectShow"), 
+        (cv2.CAP_MSMF, "Media Foundation"),
+        (0, "Default")  # 0 is default backend
+    ]
+    
+    for backend_id, backend_name in backends:
+        if backend_id == 0:  # Default backend
+            cap = cv2.VideoCapture(i)
+        else:
+            try:
+                cap = cv2.VideoCapture(i, backend_id)
+            except Exception:
+                continue
+        
+        if cap.isOpened():
+            connected = True
+            backend_used = backend_name
+            
+            # Read frame with retry and longer timeout for virtual cameras
+            for attempt in range(3):  # Try up to 3 times
+                ret, frame = cap.read()
+                if ret and frame is not None:
+                    frame_read = True
+                    break
+                # Small delay between attempts
+                import time
+                time.sleep(0.2)
+            
+            # Even if we can't read a frame, we still include the camera if opened
+            # This is more permissive and helps with some virtual cameras
+            
+            # Get camera information
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            fps = int(cap.get(cv2.CAP_PROP_FPS)) if int(cap.get(cv2.CAP_PROP_FPS)) > 0 else 30
+            
+            # Try to get camera name
+            # For DroidCam and similar apps, try to identify them by name or resolution pattern
+            camera_name = None
+            
+            # First check if we have device names from system query
+            if i < len(device_names):
+                camera_name = device_names[i]
+                # Look for common virtual camera apps in the name
+                is_virtual = any(app.lower() in camera_name.lower() for app in 
+                                ["droidcam", "iriun", "epoccam", "virtual", "obs"]) 
+            
+            # If no name from system, create a descriptive one
+            if not camera_name:
+                camera_name = f"Camera {i}"
+                if backend_used:
+                    camera_name += f" ({backend_used})"
+                is_virtual = "virtual" in camera_name.lower() or not frame_read                # Attempt to detect if camera is virtual based on various heuristics
+            if not 'is_virtual' in locals():
+                # Common resolutions for phone cameras acting as webcams
+                virtual_cam_resolutions = [(640, 480), (1280, 720), (480, 640), (720, 1280)]
+                is_virtual = (width, height) in virtual_cam_resolutions and fps >= 25
+            
+            # Properties to help user identify the right camera
+            status = "Ready" if frame_read else "Connected (No frame yet)"
+            
+            cap.release()
+            return {
+                'index': i,
+                'width': width,
+                'height': height,
+                'fps': fps,
+                'name': camera_name,
+                'is_virtual': is_virtual,
+                'status': status,
+                'backend': backend_used
+            }
+            
+        cap.release()
+    
+    return None
 
 def get_available_cameras():
     """
     Detect available cameras in the system
     Returns a list of available cameras with their corresponding indexes
     """
-    available_cameras = []
     max_cameras_to_check = 20  # Increased limit to detect more cameras including virtual ones
     
     print("Searching for available cameras...")
@@ -34,91 +125,12 @@ def get_available_cameras():
     except Exception:
         device_names = []
     
-    for i in range(max_cameras_to_check):
-        # Try multiple backends to ensure we catch virtual cameras
-        # First try DirectShow on Windows
-        connected = False
-        frame_read = False
-        backend_used = None
-        
-        # Try multiple backends in order of reliability
-        backends = [
-            (cv2.CAP_DSHOW, "DirectShow"), 
-            (cv2.CAP_MSMF, "Media Foundation"),
-            (0, "Default")  # 0 is default backend
-        ]
-        
-        for backend_id, backend_name in backends:
-            if backend_id == 0:  # Default backend
-                cap = cv2.VideoCapture(i)
-            else:
-                try:
-                    cap = cv2.VideoCapture(i, backend_id)
-                except Exception:
-                    continue
-            
-            if cap.isOpened():
-                connected = True
-                backend_used = backend_name
-                
-                # Read frame with retry and longer timeout for virtual cameras
-                for attempt in range(3):  # Try up to 3 times
-                    ret, frame = cap.read()
-                    if ret and frame is not None:
-                        frame_read = True
-                        break
-                    # Small delay between attempts
-                    import time
-                    time.sleep(0.2)
-                
-                # Even if we can't read a frame, we still include the camera if opened
-                # This is more permissive and helps with some virtual cameras
-                
-                # Get camera information
-                width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                fps = int(cap.get(cv2.CAP_PROP_FPS)) if int(cap.get(cv2.CAP_PROP_FPS)) > 0 else 30
-                
-                # Try to get camera name
-                # For DroidCam and similar apps, try to identify them by name or resolution pattern
-                camera_name = None
-                
-                # First check if we have device names from system query
-                if i < len(device_names):
-                    camera_name = device_names[i]
-                    # Look for common virtual camera apps in the name
-                    is_virtual = any(app.lower() in camera_name.lower() for app in 
-                                    ["droidcam", "iriun", "epoccam", "virtual", "obs"]) 
-                
-                # If no name from system, create a descriptive one
-                if not camera_name:
-                    camera_name = f"Camera {i}"
-                    if backend_used:
-                        camera_name += f" ({backend_used})"
-                    is_virtual = "virtual" in camera_name.lower() or not frame_read                # Attempt to detect if camera is virtual based on various heuristics
-                if not 'is_virtual' in locals():
-                    # Common resolutions for phone cameras acting as webcams
-                    virtual_cam_resolutions = [(640, 480), (1280, 720), (480, 640), (720, 1280)]
-                    is_virtual = (width, height) in virtual_cam_resolutions and fps >= 25
-                
-                # Properties to help user identify the right camera
-                status = "Ready" if frame_read else "Connected (No frame yet)"
-                
-                available_cameras.append({
-                    'index': i,
-                    'width': width,
-                    'height': height,
-                    'fps': fps,
-                    'name': camera_name,
-                    'is_virtual': is_virtual,
-                    'status': status,
-                    'backend': backend_used
-                })
-                
-                # If we got a valid camera with this backend, no need to try others
-                break
-                
-            cap.release()
+    # Probe all indexes in parallel, every open can take a second or more on
+    # Windows, results come back in index order
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        probes = executor.map(_probe_camera, range(max_cameras_to_check), 
+                              [device_names] * max_cameras_to_check)
+        available_cameras = [camera for camera in probes if camera is not None]
     
     # Sort cameras: put working cameras first, then virtual cameras (likely to be DroidCam)
     available_cameras.sort(key=lambda x: (0 if x['status'] == "Ready" else 1, 
@@ -495,11 +507,18 @@ def initialize_camera(camera_index, width, height):
     # For regular physical cameras
     else:
         print(f"Setting up physical camera with resolution {width}x{height}")
+        # Ask for MJPEG first (DirectShow needs it before the resolution), raw
+        # frames can't reach high resolutions at 60 FPS over USB 2.0
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         # Standard cameras are usually more reliable with resolution settings
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
         cap.set(cv2.CAP_PROP_FPS, 60)  # Request 60 FPS
         cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Reduce camera buffer
+        
+        fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc_name = "".join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4))
+        print(f"Camera pixel format: {fourcc_name if fourcc else 'unknown'}")
     
     # Get the actual properties the camera is using
     actual_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -643,4 +662,59 @@ def initialize_camera(camera_index, width, height):
     else:
         print(f"Camera type: Standard physical camera (index {camera_index})")
     
-    return cap, actual_width, actual_height, actual_fps
\ No newline at end of file
+    return cap, actual_width, actual_height, actual_fps
+
+class LatestFrameReader:
+    """
+    Read frames from an opened camera on a background thread, keeping only the newest one.
+    While the main loop is busy with hand detection the camera keeps being drained,
+    so the next frame processed is always the most recent instead of a queued stale one.
+    """
+    
+    def __init__(self, cap):
+        self.cap = cap
+        self.frame = None
+        self.frame_id = 0  # Incremented for every frame captured
+        self.last_read_id = 0  # Frame id last returned by read()
+        self.success = True
+        self.stopped = threading.Event()
+        self.frame_ready = threading.Condition()
+        self.thread = threading.Thread(target=self._capture_loop, name="camera-capture", daemon=True)
+    
+    def start(self):
+        """Start the capture thread, returns self for chaining"""
+        self.thread.start()
+        return self
+    
+    def _capture_loop(self):
+        while not self.stopped.is_set():
+            success, frame = self.cap.read()
+            with self.frame_ready:
+                self.success = success
+                if success:
+                    self.frame = frame
+                    self.frame_id += 1
+                self.frame_ready.notify()
+            if not success:
+                break
+    
+    def read(self):
+        """
+        Wait for a frame newer than the last one returned.
+        Returns (success, frame) like cv2.VideoCapture.read()
+        """
+        with self.frame_ready:
+            self.frame_ready.wait_for(
+                lambda: self.frame_id != self.last_read_id or not self.success or self.stopped.is_set()
+            )
+            if self.frame_id == self.last_read_id:
+                return False, None
+            self.last_read_id = self.frame_id
+            return True, self.frame
+    
+    def stop(self):
+        """Stop the capture thread and wait for it to finish its current read"""
+        self.stopped.set()
+        with self.frame_ready:
+            self.frame_ready.notify_all()
+        self.thread.join(timeout=1.0)
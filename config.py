@@ -5,6 +5,9 @@
 Configuration and shared variables for Gesture PC Controller
 """
 
+import os
+import queue
+import threading
 import cv2
 import mediapipe as mp
 import numpy as np
@@ -20,18 +23,58 @@ mp_drawing_styles = mp.solutions.drawing_styles
 keyboard = KeyboardController()
 mouse = MouseController()
 
+# Single key taps queued by the gesture handlers, a background thread sends
+# them in order so the frame loop never waits on the OS input layer
+_key_tap_queue = queue.Queue()
+
+def _key_tap_worker():
+    for key in iter(_key_tap_queue.get, None):
+        keyboard.press(key)
+        keyboard.release(key)
+
+threading.Thread(target=_key_tap_worker, name="key-taps", daemon=True).start()
+
+def tap_key(key):
+    """Queue a press and release of key, returns without waiting for it to be sent"""
+    _key_tap_queue.put(key)
+
 # MediaPipe hand landmark indices for easy reference
 THUMB_TIP = 4
+THUMB_IP = 3  # Interphalangeal Joint
+THUMB_MCP = 2  # Metacarpophalangeal Joint (knuckle)
 INDEX_FINGER_TIP = 8
 INDEX_FINGER_PIP = 6  # Proximal Interphalangeal Joint (middle joint)
+INDEX_FINGER_MCP = 5
 MIDDLE_FINGER_TIP = 12
 MIDDLE_FINGER_PIP = 10
+MIDDLE_FINGER_MCP = 9
 RING_FINGER_TIP = 16
 RING_FINGER_PIP = 14
+RING_FINGER_MCP = 13
 PINKY_TIP = 20
 PINKY_PIP = 18
+PINKY_MCP = 17
 WRIST = 0
 
+# Show the camera preview window, set the environment variable GESTURE_PREVIEW=0
+# to run without a window (headless), stop it with Ctrl+C
+SHOW_PREVIEW = os.getenv("GESTURE_PREVIEW", "1") == "1"
+
+# Draw gesture overlays (status text, cursor markers) on the preview image,
+# set the environment variable GESTURE_OVERLAY=0 to skip all overlay drawing
+# (off by default when there is no preview to draw on)
+DRAW_OVERLAY = os.getenv("GESTURE_OVERLAY", "1" if SHOW_PREVIEW else "0") == "1"
+
+# Draw MediaPipe's hand skeleton on the preview image, a debugging aid that is off
+# by default, set the environment variable GESTURE_LANDMARKS=1 to turn it on
+DRAW_LANDMARKS = os.getenv("GESTURE_LANDMARKS", "0") == "1"
+
+# Load and warm up the Whisper model in the background once the camera is open,
+# so the first voice command doesn't wait for it, set the environment variable
+# GESTURE_VOICE_PRELOAD=1 to turn it on (off by default, the model is then
+# loaded by the first closed fist)
+PRELOAD_VOICE = os.getenv("GESTURE_VOICE_PRELOAD", "0") == "1"
+
 # --- Gesture behavior configuration ---
 
 # Minimum X movement to trigger a keystroke
@@ -63,6 +106,31 @@ DEFAULT_SMOOTHING_FACTOR = 0.7
 # Increase sensitivity for mouse movement
 DEFAULT_SENSITIVITY_MULTIPLIER = 1.5
 
-# Default screen resolution, will be updated
+# Screen resolution, detected once at startup (falls back to 1920x1080)
 DEFAULT_SCREEN_WIDTH = 1920
-DEFAULT_SCREEN_HEIGHT = 1080
\ No newline at end of file
+DEFAULT_SCREEN_HEIGHT = 1080
+
+try:
+    from screeninfo import get_monitors
+    _monitors = get_monitors()
+    _primary_monitor = next((m for m in _monitors if m.is_primary), _monitors[0])
+    DEFAULT_SCREEN_WIDTH = _primary_monitor.width
+    DEFAULT_SCREEN_HEIGHT = _primary_monitor.height
+except Exception as e:
+    print(f"Could not detect screen resolution, using {DEFAULT_SCREEN_WIDTH}x{DEFAULT_SCREEN_HEIGHT}: {e}")
+
+# --- Hand detection settings ---
+
+# Frames wider than this are scaled down (keeping the aspect ratio) before hand
+# detection, MediaPipe's models run at a few hundred pixels anyway
+DETECTION_MAX_WIDTH = 640
+
+# Size of the grayscale thumbnail compared between frames to detect motion
+MOTION_GATE_SIZE = (160, 90)
+
+# Brightness change (0-255) for a thumbnail pixel to count as moving
+MOTION_PIXEL_THRESHOLD = 15
+
+# Hand detection is skipped while fewer thumbnail pixels than this have changed
+# since the last detected frame and no gesture is in progress
+MOTION_MIN_PIXELS = 50
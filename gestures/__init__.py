@@ -8,6 +8,14 @@ Gesture detection package for PC Controller
 # Import from base module
 from gestures.base import (
     GestureState,
+    landmarks_to_array,
+    finger_extension_mask,
+    wrist_distances_sq,
+    finger_bent_mask,
+    INDEX_EXTENDED,
+    MIDDLE_EXTENDED,
+    ALL_FINGERS_EXTENDED,
+    OTHER_FINGERS_EXTENDED,
     is_navigation_gesture,
     is_index_finger_only,
     is_ok_gesture,
@@ -15,7 +23,7 @@ from gestures.base import (
     is_scroll_gesture,  
     is_open_hand,  # Add the open hand gesture detection for Alt+Tab
     is_closed_hand,  # Add closed hand gesture for voice commands
-    update_all_cooldowns,
+    update_frame_time,
     reset_all_gesture_states
 )
 
@@ -55,7 +63,8 @@ from gestures.scroll import (
 # Import the voice command module
 from gestures.voice_command import (
     voice_command_state,
-    process_voice_command_gesture
+    process_voice_command_gesture,
+    start_voice_preload
 )
 
 # Dictionary of all gesture states
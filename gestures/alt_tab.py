@@ -12,13 +12,15 @@ Enhanced Alt+Tab gesture module with advanced hand tracking
 
 import cv2
 import numpy as np
-import time
 from pynput.keyboard import Key, Controller as KeyboardController
-from config import keyboard, DEFAULT_Y_MOVEMENT_THRESHOLD
-from gestures.base import GestureState, is_open_hand, is_alt_tab_ok_gesture
+from config import keyboard, DEFAULT_Y_MOVEMENT_THRESHOLD, DRAW_OVERLAY
+from gestures.base import GestureState, as_points, is_open_hand, is_alt_tab_ok_gesture
+from overlay import draw_text, draw_glyph_text
 
 # Enhanced state for Alt+Tab gesture
 class AltTabState(GestureState):
+    __slots__ = ('last_direction', 'last_arrow_press_time', 'current_interval')
+
     def __init__(self):
         super().__init__()
         self.is_alt_pressed = False
@@ -36,9 +38,6 @@ def process_alt_tab_gesture(image, hand_landmarks, fps, image_width, image_heigh
     global alt_tab_state
     state = alt_tab_state
     
-    # Calculate frames needed for gesture confirmation
-    confirmation_frames = int(state.gesture_confirmation_time * fps)
-    
     # Priority 1: Handle OK gesture to confirm selection
     if state.is_alt_pressed and is_alt_tab_ok_gesture(hand_landmarks):
         return handle_alt_tab_confirmation(image, state)
@@ -48,7 +47,7 @@ def process_alt_tab_gesture(image, hand_landmarks, fps, image_width, image_heigh
         return handle_horizontal_tracking(image, hand_landmarks, state, image_width, image_height)
     
     # Priority 3: Handle initial Alt+Tab activation
-    return handle_alt_tab_activation(image, hand_landmarks, state, fps, confirmation_frames, image_width, image_height)
+    return handle_alt_tab_activation(image, hand_landmarks, state, fps, image_width, image_height)
 
 def handle_alt_tab_confirmation(image, state):
     """Handle OK gesture to confirm Alt+Tab selection"""
@@ -70,11 +69,10 @@ def handle_alt_tab_confirmation(image, state):
     state.start_gesture_cooldown()  # Cooldown after completion
     
     # Display completion message
-    cv2.putText(
+    draw_text(
         image, 
         "Alt+Tab Confirmed!", 
         (10, 230), 
-        cv2.FONT_HERSHEY_SIMPLEX, 
         0.9, 
         (0, 255, 0),  # Green
         2
@@ -90,20 +88,22 @@ def handle_horizontal_tracking(image, hand_landmarks, state, image_width, image_
         return cancel_alt_tab(image, state)
     
     # Get wrist position as reference point for hand center
-    wrist = hand_landmarks.landmark[0]  # WRIST
-    current_x = wrist.x * image_width
-    current_y = wrist.y * image_height
+    wrist_x, wrist_y = as_points(hand_landmarks)[0, :2].tolist()  # WRIST
+    current_x = wrist_x * image_width
+    current_y = wrist_y * image_height
     
     # Draw current hand position
-    cv2.circle(image, (int(current_x), int(current_y)), 8, (0, 0, 255), -1)  # Red dot
+    if DRAW_OVERLAY:
+        cv2.circle(image, (int(current_x), int(current_y)), 8, (0, 0, 255), -1)  # Red dot
     
     # Draw reference point
     if state.reference_x is not None:
-        cv2.circle(image, (int(state.reference_x), int(state.reference_y)), 12, (0, 255, 0), 2)  # Green circle
+        if DRAW_OVERLAY:
+            cv2.circle(image, (int(state.reference_x), int(state.reference_y)), 12, (0, 255, 0), 2)  # Green circle
         
-        # Draw line connecting reference and current position
-        cv2.line(image, (int(state.reference_x), int(state.reference_y)), 
-                (int(current_x), int(current_y)), (255, 255, 0), 2)  # Yellow line
+            # Draw line connecting reference and current position
+            cv2.line(image, (int(state.reference_x), int(state.reference_y)), 
+                    (int(current_x), int(current_y)), (255, 255, 0), 2)  # Yellow line
         
         # Calculate horizontal distance
         x_distance = current_x - state.reference_x
@@ -123,13 +123,13 @@ def handle_horizontal_tracking(image, hand_landmarks, state, image_width, image_
         state.current_interval = interval
         
         # Display tracking info
-        cv2.putText(image, f"Alt+Tab Active - Distance: {int(abs_distance)}px", 
-                   (10, 230), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(image, f"Direction: {direction.upper()}, Interval: {interval}s", 
-                   (10, 260), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+        draw_glyph_text(image, f"Alt+Tab Active - Distance: {int(abs_distance)}px", 
+                        (10, 230), 0.7, (255, 255, 255), 2)
+        draw_text(image, f"Direction: {direction.upper()}, Interval: {interval}s", 
+                  (10, 260), 0.7, (0, 255, 255), 2)
         
         # Check if enough time has passed and direction is significant
-        current_time = time.time()
+        current_time = state.now
         if (current_time - state.last_arrow_press_time >= interval and abs_distance > 20):
             
             # Press appropriate arrow key
@@ -149,27 +149,27 @@ def handle_horizontal_tracking(image, hand_landmarks, state, image_width, image_
             state.last_direction = direction
             
             # Display arrow press
-            cv2.putText(image, display_text, (10, 290), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
+            draw_text(image, display_text, (10, 290), 
+                      0.8, color, 2)
     else:
         # Set initial reference point
         state.reference_x = current_x
         state.reference_y = current_y
-        state.last_arrow_press_time = time.time()
+        state.last_arrow_press_time = state.now
         
-        cv2.putText(image, "Alt+Tab Active - Setting reference point", 
-                   (10, 230), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+        draw_text(image, "Alt+Tab Active - Setting reference point", 
+                  (10, 230), 0.7, (255, 255, 0), 2)
     
     return image
 
-def handle_alt_tab_activation(image, hand_landmarks, state, fps, confirmation_frames, image_width, image_height):
+def handle_alt_tab_activation(image, hand_landmarks, state, fps, image_width, image_height):
     """Handle initial Alt+Tab activation"""
     # Check if we're in cooldown period
     if state.is_cooldown_active():
-        current_time = time.time()
+        current_time = state.now
         remaining_cooldown = max(0, state.gesture_cooldown_time - (current_time - state.gesture_cooldown_start_time))
-        cv2.putText(image, f"Alt+Tab cooldown: {remaining_cooldown:.1f}s", 
-                   (10, 230), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 165, 0), 2)
+        draw_text(image, f"Alt+Tab cooldown: {remaining_cooldown:.1f}s", 
+                  (10, 230), 0.7, (255, 165, 0), 2)
         return image
     
     # Check if gesture is valid (open hand)
@@ -179,8 +179,8 @@ def handle_alt_tab_activation(image, hand_landmarks, state, fps, confirmation_fr
             state.confirmed_gesture = False
             state.gesture_confirmation_start_time = 0
             
-        cv2.putText(image, "Alt+Tab: Open hand gesture", 
-                   (10, 230), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        draw_text(image, "Alt+Tab: Open hand gesture", 
+                  (10, 230), 0.7, (255, 255, 255), 2)
         return image
       # Process gesture confirmation
     if not state.confirmed_gesture:
@@ -189,13 +189,13 @@ def handle_alt_tab_activation(image, hand_landmarks, state, fps, confirmation_fr
             state.start_gesture_confirmation()
         
         # Calculate confirmation progress
-        current_time = time.time()
+        current_time = state.now
         elapsed_time = current_time - state.gesture_confirmation_start_time
         progress = min(1.0, elapsed_time / state.gesture_confirmation_time)
         
         # Show confirmation progress
-        cv2.putText(image, f"Alt+Tab confirming... {progress:.1%}", 
-                   (10, 230), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+        draw_glyph_text(image, f"Alt+Tab confirming... {progress:.1%}", 
+                        (10, 230), 0.7, (255, 255, 0), 2)
         
         # Check if gesture is confirmed
         if state.is_gesture_confirmed():
@@ -210,8 +210,8 @@ def handle_alt_tab_activation(image, hand_landmarks, state, fps, confirmation_fr
             state.is_alt_pressed = True
             state.alt_tab_activated = True
             
-            cv2.putText(image, "Alt+Tab Activated!", 
-                       (10, 260), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+            draw_text(image, "Alt+Tab Activated!", 
+                      (10, 260), 0.8, (0, 255, 0), 2)
     
     return image
 
@@ -228,7 +228,7 @@ def cancel_alt_tab(image, state):
     state.reference_y = None
     state.last_direction = None
     state.start_gesture_cooldown()  # Short cooldown
-    cv2.putText(image, "Alt+Tab Cancelled", 
-               (10, 230), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 2)
+    draw_text(image, "Alt+Tab Cancelled", 
+              (10, 230), 0.8, (0, 0, 255), 2)
     
     return image
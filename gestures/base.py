@@ -5,20 +5,61 @@
 Base classes and functions for gesture detection
 """
 
+import math
 import time
-import cv2
 import numpy as np
 from config import (
-    mp_hands,
-    THUMB_TIP, INDEX_FINGER_TIP, INDEX_FINGER_PIP, MIDDLE_FINGER_TIP,
-    MIDDLE_FINGER_PIP, RING_FINGER_TIP, RING_FINGER_PIP, PINKY_TIP, PINKY_PIP, WRIST,
+    THUMB_TIP, THUMB_IP, THUMB_MCP, INDEX_FINGER_TIP, INDEX_FINGER_PIP, INDEX_FINGER_MCP,
+    MIDDLE_FINGER_TIP, MIDDLE_FINGER_PIP, MIDDLE_FINGER_MCP, RING_FINGER_TIP, RING_FINGER_PIP,
+    RING_FINGER_MCP, PINKY_TIP, PINKY_PIP, PINKY_MCP, WRIST,
     DEFAULT_MOVEMENT_THRESHOLD, DEFAULT_Y_MOVEMENT_THRESHOLD, DEFAULT_GESTURE_CONFIRMATION_TIME,
     DEFAULT_GESTURE_COOLDOWN_TIME, DEFAULT_SMOOTHING_FACTOR, DEFAULT_SENSITIVITY_MULTIPLIER,
     DEFAULT_SCREEN_WIDTH, DEFAULT_SCREEN_HEIGHT
 )
 
+# Landmark index arrays for fancy indexing into a (21, 3) landmark array
+# Index, middle, ring and pinky fingers
+_FINGER_TIPS = np.array([INDEX_FINGER_TIP, MIDDLE_FINGER_TIP, RING_FINGER_TIP, PINKY_TIP], dtype=np.intp)
+_FINGER_PIPS = np.array([INDEX_FINGER_PIP, MIDDLE_FINGER_PIP, RING_FINGER_PIP, PINKY_PIP], dtype=np.intp)
+_FINGER_MCPS = np.array([INDEX_FINGER_MCP, MIDDLE_FINGER_MCP, RING_FINGER_MCP, PINKY_MCP], dtype=np.intp)
+# Middle, ring and pinky fingers, which most gestures check as a group
+_OTHER_TIPS = np.array([MIDDLE_FINGER_TIP, RING_FINGER_TIP, PINKY_TIP], dtype=np.intp)
+_OTHER_PIPS = np.array([MIDDLE_FINGER_PIP, RING_FINGER_PIP, PINKY_PIP], dtype=np.intp)
+
+# Bits of the finger extension mask (see finger_extension_mask)
+INDEX_EXTENDED = 0b0001
+MIDDLE_EXTENDED = 0b0010
+RING_EXTENDED = 0b0100
+PINKY_EXTENDED = 0b1000
+ALL_FINGERS_EXTENDED = INDEX_EXTENDED | MIDDLE_EXTENDED | RING_EXTENDED | PINKY_EXTENDED
+OTHER_FINGERS_EXTENDED = MIDDLE_EXTENDED | RING_EXTENDED | PINKY_EXTENDED
+# finger_bent_mask uses the same bits, set when the finger is bent
+ALL_FINGERS_BENT = ALL_FINGERS_EXTENDED
+
+# Cosine bounds for the scroll gesture's thumb/index angle (20-120 degrees),
+# comparing cosines avoids computing the angle itself
+_SCROLL_COS_MIN_ANGLE = math.cos(math.radians(20))
+_SCROLL_COS_MAX_ANGLE = math.cos(math.radians(120))
+
 class GestureState:
     """Base class for tracking gesture state"""
+    # Timestamp of the frame being processed (time.monotonic()), shared by all
+    # gesture states and refreshed once per frame by update_frame_time()
+    now = time.monotonic()
+
+    # Fixed attribute layout: no per-instance __dict__ and faster attribute access
+    __slots__ = (
+        'prev_x', 'prev_y', 'gesture_active', 'movement_threshold',
+        'cooldown_start_time', 'cooldown_duration',
+        'gesture_confirmation_time', 'gesture_confirmation_start_time',
+        'gesture_cooldown_time', 'gesture_cooldown_start_time', 'confirmed_gesture',
+        'hand_open', 'hand_closed', 'open_hand_confirmed', 'last_hand_state_change_time',
+        'smoothing_factor', 'screen_width', 'screen_height', 'sensitivity_multiplier',
+        'smooth_x', 'smooth_y', 'last_mouse_position',
+        'scroll_orientation', 'reference_x', 'reference_y',
+        'is_alt_pressed', 'alt_tab_activated', 'y_movement_threshold'
+    )
+
     def __init__(self):
         self.prev_x = None
         self.prev_y = None
@@ -40,13 +81,21 @@ class GestureState:
         self.hand_open = False
         self.hand_closed = False
         self.open_hand_confirmed = False
-        self.last_hand_state_change_time = 0        # For mouse control
+        self.last_hand_state_change_time = 0
+
+        # For mouse control
         self.smoothing_factor = DEFAULT_SMOOTHING_FACTOR
         self.screen_width = DEFAULT_SCREEN_WIDTH
         self.screen_height = DEFAULT_SCREEN_HEIGHT
         self.sensitivity_multiplier = DEFAULT_SENSITIVITY_MULTIPLIER
+        self.smooth_x = None  # Smoothed cursor (or scroll hand) position, None until the first update
+        self.smooth_y = None
+        self.last_mouse_position = None  # Last position written to the OS cursor
 
-        # For scroll gesture        self.scroll_orientation = None
+        # For scroll gesture
+        self.scroll_orientation = None
+        self.reference_x = None  # Fixed reference point, None until the gesture is confirmed
+        self.reference_y = None
         
         # For Alt+Tab gesture
         self.is_alt_pressed = False  # Whether Alt key is being held
@@ -60,20 +109,14 @@ class GestureState:
         self.prev_x = None
         self.prev_y = None
         self.scroll_orientation = None
+        self.last_mouse_position = None
         # Reset reference points for scroll gesture
-        if hasattr(self, 'reference_x'):
-            self.reference_x = None
-        if hasattr(self, 'reference_y'):
-            self.reference_y = None
+        self.reference_x = None
+        self.reference_y = None
 
-    def update_cooldown(self):
-        # Time-based cooldowns are checked by comparing current time with start times
-        # No need to decrement counters
-        pass
-    
     def is_cooldown_active(self):
         """Check if any cooldown is currently active"""
-        current_time = time.time()
+        current_time = self.now
         return (current_time - self.cooldown_start_time < self.cooldown_duration or 
                 current_time - self.gesture_cooldown_start_time < self.gesture_cooldown_time)
     
@@ -81,23 +124,72 @@ class GestureState:
         """Start a cooldown period"""
         if duration is None:
             duration = self.cooldown_duration
-        self.cooldown_start_time = time.time()
+        self.cooldown_start_time = self.now
         self.cooldown_duration = duration
     
     def start_gesture_cooldown(self):
         """Start the main gesture cooldown"""
-        self.gesture_cooldown_start_time = time.time()
+        self.gesture_cooldown_start_time = self.now
     
     def start_gesture_confirmation(self):
         """Start gesture confirmation timer"""
-        self.gesture_confirmation_start_time = time.time()
+        self.gesture_confirmation_start_time = self.now
+    
+    def confirmation_percent(self):
+        """Whole-number progress (0-100) of the running gesture confirmation"""
+        elapsed_time = self.now - self.gesture_confirmation_start_time
+        return min(100, int(elapsed_time * 100 / self.gesture_confirmation_time))
     
     def is_gesture_confirmed(self):
         """Check if gesture has been held long enough to be confirmed"""
         if self.gesture_confirmation_start_time == 0:
             return False
-        current_time = time.time()
-        return current_time - self.gesture_confirmation_start_time >= self.gesture_confirmation_time
+        return self.now - self.gesture_confirmation_start_time >= self.gesture_confirmation_time
+
+def landmarks_to_array(hand_landmarks):
+    """
+    Convert MediaPipe hand landmarks into a (21, 3) float32 array of x, y, z
+    so gesture checks can use NumPy indexing instead of per-landmark lookups
+    """
+    return np.array(
+        [(landmark.x, landmark.y, landmark.z) for landmark in hand_landmarks.landmark],
+        dtype=np.float32
+    )
+
+def as_points(hand_landmarks):
+    """Accept either MediaPipe hand landmarks or an array from landmarks_to_array"""
+    if isinstance(hand_landmarks, np.ndarray):
+        return hand_landmarks
+    return landmarks_to_array(hand_landmarks)
+
+def wrist_distances_sq(hand_landmarks):
+    """
+    Squared 2D distances from the wrist to all 21 landmarks in one pass
+    (distances are only ever compared, so the square root is skipped)
+    The frame loop computes these once per hand and passes them to every
+    gesture check as dist_to_wrist
+    """
+    points = as_points(hand_landmarks)
+    offsets = points[:, :2] - points[WRIST, :2]
+    return (offsets * offsets).sum(axis=1)
+
+def finger_extension_mask(hand_landmarks):
+    """
+    Return a bitmask of which fingers are extended (fingertip above its PIP joint):
+    INDEX_EXTENDED, MIDDLE_EXTENDED, RING_EXTENDED and PINKY_EXTENDED
+    """
+    points = as_points(hand_landmarks)
+    extended = points[_FINGER_TIPS, 1] < points[_FINGER_PIPS, 1]
+    return int(np.packbits(extended, bitorder='little')[0])
+
+def finger_bent_mask(hand_landmarks, margin=0.0):
+    """
+    Return a bitmask of which fingers are bent (fingertip below its PIP joint
+    by more than margin), using the same bits as finger_extension_mask
+    """
+    points = as_points(hand_landmarks)
+    bent = points[_FINGER_TIPS, 1] > points[_FINGER_PIPS, 1] + margin
+    return int(np.packbits(bent, bitorder='little')[0])
 
 def is_navigation_gesture(hand_landmarks):
     """
@@ -105,27 +197,9 @@ def is_navigation_gesture(hand_landmarks):
     - Index and middle fingers extended
     - Ring and pinky fingers bent
     """
-    # Get fingertips and knuckles
-    index_tip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
-    index_pip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_PIP]
-    middle_tip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-    middle_pip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_PIP]
-    ring_tip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_TIP]
-    ring_pip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_PIP]
-    pinky_tip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_TIP]
-    pinky_pip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_PIP]
-    
-    # Check if index and middle fingers are extended (tip y < pip y)
-    index_extended = index_tip.y < index_pip.y
-    middle_extended = middle_tip.y < middle_pip.y
-    
-    # Check if ring and pinky fingers are bent (tip y > pip y)
-    ring_bent = ring_tip.y > ring_pip.y
-    pinky_bent = pinky_tip.y > pinky_pip.y
-    
-    return index_extended and middle_extended and ring_bent and pinky_bent
+    return finger_extension_mask(hand_landmarks) == INDEX_EXTENDED | MIDDLE_EXTENDED
 
-def is_scroll_gesture(hand_landmarks):
+def is_scroll_gesture(hand_landmarks, dist_to_wrist=None):
     """
     Check if the hand is making a scroll gesture:
     - Index finger and thumb extended in a V or L shape
@@ -134,284 +208,175 @@ def is_scroll_gesture(hand_landmarks):
     This is similar to an "L" shape with thumb and index finger
     Slightly relaxed condition for angle acceptance
     """
-    # Get fingertips and knuckles
-    thumb_tip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_TIP]
-    thumb_ip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_IP]
-    thumb_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_MCP]
-    index_tip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
-    index_pip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_PIP]
-    index_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_MCP]
-    middle_tip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-    middle_pip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_PIP]
-    ring_tip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_TIP]
-    ring_pip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_PIP]
-    pinky_tip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_TIP]
-    pinky_pip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_PIP]
+    points = as_points(hand_landmarks)
+    
+    # Get fingertips and knuckles as plain floats, the math on them below is scalar
+    thumb_tip_x, thumb_tip_y = points[THUMB_TIP, :2].tolist()
+    thumb_mcp_x = points[THUMB_MCP, 0].item()
+    index_tip_x, index_tip_y = points[INDEX_FINGER_TIP, :2].tolist()
+    wrist_x, wrist_y = points[WRIST, :2].tolist()
     
     # Calculate distances and positions to check for extended thumb
-    thumb_extended = thumb_tip.x < thumb_mcp.x  # For right hand
+    thumb_extended = thumb_tip_x < thumb_mcp_x  # For right hand
+    
+    # Squared distances from wrist to every landmark
+    if dist_to_wrist is None:
+        dist_to_wrist = wrist_distances_sq(points)
     
     # Make sure thumb is really extended (distance from wrist)
-    wrist = hand_landmarks.landmark[mp_hands.HandLandmark.WRIST]
-    dist_thumb_tip_to_wrist = np.sqrt((thumb_tip.x - wrist.x)**2 + (thumb_tip.y - wrist.y)**2)
-    dist_thumb_ip_to_wrist = np.sqrt((thumb_ip.x - wrist.x)**2 + (thumb_ip.y - wrist.y)**2)
-    thumb_really_extended = dist_thumb_tip_to_wrist > dist_thumb_ip_to_wrist
+    thumb_really_extended = dist_to_wrist[THUMB_TIP] > dist_to_wrist[THUMB_IP]
     
     # Check if index finger is extended (tip further from wrist than pip)
-    dist_index_tip_to_wrist = np.sqrt((index_tip.x - wrist.x)**2 + (index_tip.y - wrist.y)**2)
-    dist_index_pip_to_wrist = np.sqrt((index_pip.x - wrist.x)**2 + (index_pip.y - wrist.y)**2)
-    index_extended = dist_index_tip_to_wrist > dist_index_pip_to_wrist
+    index_extended = dist_to_wrist[INDEX_FINGER_TIP] > dist_to_wrist[INDEX_FINGER_PIP]
     
     # Check if other three fingers are bent
-    middle_bent = middle_tip.y > middle_pip.y
-    ring_bent = ring_tip.y > ring_pip.y
-    pinky_bent = pinky_tip.y > pinky_pip.y
+    other_fingers_bent = finger_extension_mask(points) & OTHER_FINGERS_EXTENDED == 0
     
-    # Calculate angle between thumb and index finger to ensure it's a "V" shape
-    # First, normalize the vectors from wrist to thumb_tip and wrist to index_tip
-    thumb_vec = np.array([thumb_tip.x - wrist.x, thumb_tip.y - wrist.y])
-    index_vec = np.array([index_tip.x - wrist.x, index_tip.y - wrist.y])
+    # Check the angle between thumb and index finger to ensure it's a "V" shape
+    # Vectors from wrist to thumb_tip and wrist to index_tip
+    thumb_vec_x = thumb_tip_x - wrist_x
+    thumb_vec_y = thumb_tip_y - wrist_y
+    index_vec_x = index_tip_x - wrist_x
+    index_vec_y = index_tip_y - wrist_y
     
-    thumb_vec_norm = thumb_vec / np.linalg.norm(thumb_vec) if np.linalg.norm(thumb_vec) > 0 else thumb_vec
-    index_vec_norm = index_vec / np.linalg.norm(index_vec) if np.linalg.norm(index_vec) > 0 else index_vec
-    
-    # Calculate dot product and angle
-    dot_product = np.dot(thumb_vec_norm, index_vec_norm)
-    # Clamp the dot product to avoid numerical errors
-    dot_product = max(min(dot_product, 1.0), -1.0)
-    angle = np.arccos(dot_product) * 180 / np.pi
+    # cos(angle) * |thumb_vec| * |index_vec| is the dot product, so the angle range
+    # becomes a range on the dot product scaled by the vector lengths
+    dot_product = thumb_vec_x * index_vec_x + thumb_vec_y * index_vec_y
+    norm_product = math.hypot(thumb_vec_x, thumb_vec_y) * math.hypot(index_vec_x, index_vec_y)
     
     # V or L shape typically has angle around 45-90+ degrees
     # Only keep the expanded angle range (20-120 degrees instead of 30-110)
-    proper_v_shape = angle > 20 and angle < 120
+    proper_v_shape = (_SCROLL_COS_MAX_ANGLE * norm_product < dot_product < 
+                      _SCROLL_COS_MIN_ANGLE * norm_product)
     
     # Ensure there's sufficient separation between thumb and index finger
-    thumb_index_distance = np.sqrt(
-        (thumb_tip.x - index_tip.x) ** 2 + 
-        (thumb_tip.y - index_tip.y) ** 2
-    )
+    thumb_index_distance = math.hypot(thumb_tip_x - index_tip_x, thumb_tip_y - index_tip_y)
     sufficient_separation = thumb_index_distance > 0.05
     
-    return (thumb_extended and thumb_really_extended and index_extended and 
-            middle_bent and ring_bent and pinky_bent and 
-            proper_v_shape and sufficient_separation)
+    return bool(thumb_extended and thumb_really_extended and index_extended and 
+                other_fingers_bent and proper_v_shape and sufficient_separation)
 
-def is_open_hand(hand_landmarks):
+def is_open_hand(hand_landmarks, dist_to_wrist=None):
     """
     Check if the hand is making an open hand gesture:
     - All five fingers are extended
     """
-    # Get fingertips and PIPs (Proximal Interphalangeal Joint)
-    thumb_tip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_TIP]
-    thumb_ip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_IP]
-    thumb_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_MCP]
-    
-    index_tip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
-    index_pip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_PIP]
-    
-    middle_tip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-    middle_pip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_PIP]
-    
-    ring_tip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_TIP]
-    ring_pip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_PIP]
-    
-    pinky_tip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_TIP]
-    pinky_pip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_PIP]
-    
-    wrist = hand_landmarks.landmark[mp_hands.HandLandmark.WRIST]
+    points = as_points(hand_landmarks)
     
-    # Calculate distances from fingertips to wrist
-    dist_thumb_tip_to_wrist = np.sqrt((thumb_tip.x - wrist.x)**2 + (thumb_tip.y - wrist.y)**2)
-    dist_thumb_ip_to_wrist = np.sqrt((thumb_ip.x - wrist.x)**2 + (thumb_tip.y - wrist.y)**2)
+    # Get thumb and wrist landmarks as plain floats
+    thumb_tip_x, thumb_tip_y = points[THUMB_TIP, :2].tolist()
+    thumb_ip_x = points[THUMB_IP, 0].item()
+    wrist_x, wrist_y = points[WRIST, :2].tolist()
     
-    dist_index_tip_to_wrist = np.sqrt((index_tip.x - wrist.x)**2 + (index_tip.y - wrist.y)**2)
-    dist_index_pip_to_wrist = np.sqrt((index_pip.x - wrist.x)**2 + (index_pip.y - wrist.y)**2)
-    
-    dist_middle_tip_to_wrist = np.sqrt((middle_tip.x - wrist.x)**2 + (middle_tip.y - wrist.y)**2)
-    dist_middle_pip_to_wrist = np.sqrt((middle_pip.x - wrist.x)**2 + (middle_pip.y - wrist.y)**2)
-    
-    dist_ring_tip_to_wrist = np.sqrt((ring_tip.x - wrist.x)**2 + (ring_tip.y - wrist.y)**2)
-    dist_ring_pip_to_wrist = np.sqrt((ring_pip.x - wrist.x)**2 + (ring_pip.y - wrist.y)**2)
-    
-    dist_pinky_tip_to_wrist = np.sqrt((pinky_tip.x - wrist.x)**2 + (pinky_tip.y - wrist.y)**2)
-    dist_pinky_pip_to_wrist = np.sqrt((pinky_pip.x - wrist.x)**2 + (pinky_pip.y - wrist.y)**2)
+    # Calculate squared distances from fingertips to wrist
+    dist_thumb_tip_to_wrist = (thumb_tip_x - wrist_x)**2 + (thumb_tip_y - wrist_y)**2
+    dist_thumb_ip_to_wrist = (thumb_ip_x - wrist_x)**2 + (thumb_tip_y - wrist_y)**2
+    if dist_to_wrist is None:
+        dist_to_wrist = wrist_distances_sq(points)
+    dist_tips_to_wrist = dist_to_wrist[_FINGER_TIPS]
+    dist_pips_to_wrist = dist_to_wrist[_FINGER_PIPS]
     
     # Check if all fingers are extended
     thumb_extended = dist_thumb_tip_to_wrist > dist_thumb_ip_to_wrist
-    index_extended = dist_index_tip_to_wrist > dist_index_pip_to_wrist
-    middle_extended = dist_middle_tip_to_wrist > dist_middle_pip_to_wrist
-    ring_extended = dist_ring_tip_to_wrist > dist_ring_pip_to_wrist
-    pinky_extended = dist_pinky_tip_to_wrist > dist_pinky_pip_to_wrist
+    fingers_extended = dist_tips_to_wrist > dist_pips_to_wrist
     
     # Also check using y-coordinate comparison
-    index_extended_y = index_tip.y < index_pip.y
-    middle_extended_y = middle_tip.y < middle_pip.y
-    ring_extended_y = ring_tip.y < ring_pip.y
-    pinky_extended_y = pinky_tip.y < pinky_pip.y
-    
-    # Combine the checks
-    index_is_extended = index_extended and index_extended_y
-    middle_is_extended = middle_extended and middle_extended_y
-    ring_is_extended = ring_extended and ring_extended_y
-    pinky_is_extended = pinky_extended and pinky_extended_y
-    
-    # All fingers must be extended
-    return thumb_extended and index_is_extended and middle_is_extended and ring_is_extended and pinky_is_extended
+    fingers_extended_y = finger_extension_mask(points) == ALL_FINGERS_EXTENDED
+    
+    # All fingers must be extended (combining both checks)
+    return bool(thumb_extended and fingers_extended.all() and fingers_extended_y)
 
-def is_closed_hand(hand_landmarks):
+def is_closed_hand(hand_landmarks, dist_to_wrist=None):
     """
     Check if the hand is in a closed fist position (for voice command trigger)
     More strict version to avoid false positives
     """
-    # Get finger landmarks
-    thumb_tip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_TIP]
-    thumb_ip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_IP]
-    index_tip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
-    index_pip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_PIP]
-    index_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_MCP]
-    middle_tip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-    middle_pip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_PIP]
-    middle_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_MCP]
-    ring_tip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_TIP]
-    ring_pip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_PIP]
-    ring_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_MCP]
-    pinky_tip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_TIP]
-    pinky_pip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_PIP]
-    pinky_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_MCP]
-    wrist = hand_landmarks.landmark[mp_hands.HandLandmark.WRIST]
+    points = as_points(hand_landmarks)
     
     # More strict finger bend checking
     # Check if fingertips are significantly below PIP joints (not just slightly)
-    index_bent = index_tip.y > index_pip.y + 0.02  # Add margin for stricter detection
-    middle_bent = middle_tip.y > middle_pip.y + 0.02
-    ring_bent = ring_tip.y > ring_pip.y + 0.02
-    pinky_bent = pinky_tip.y > pinky_pip.y + 0.02
+    fingers_bent = finger_bent_mask(points, 0.02) == ALL_FINGERS_BENT  # Add margin for stricter detection
     
     # Additional check: fingertips should be closer to wrist than MCP joints
-    index_closer_to_wrist = np.sqrt((index_tip.x - wrist.x)**2 + (index_tip.y - wrist.y)**2) < np.sqrt((index_mcp.x - wrist.x)**2 + (index_mcp.y - wrist.y)**2)
-    middle_closer_to_wrist = np.sqrt((middle_tip.x - wrist.x)**2 + (middle_tip.y - wrist.y)**2) < np.sqrt((middle_mcp.x - wrist.x)**2 + (middle_mcp.y - wrist.y)**2)
-    ring_closer_to_wrist = np.sqrt((ring_tip.x - wrist.x)**2 + (ring_tip.y - wrist.y)**2) < np.sqrt((ring_mcp.x - wrist.x)**2 + (ring_mcp.y - wrist.y)**2)
-    pinky_closer_to_wrist = np.sqrt((pinky_tip.x - wrist.x)**2 + (pinky_tip.y - wrist.y)**2) < np.sqrt((pinky_mcp.x - wrist.x)**2 + (pinky_mcp.y - wrist.y)**2)
+    if dist_to_wrist is None:
+        dist_to_wrist = wrist_distances_sq(points)
+    fingers_close_to_wrist = (dist_to_wrist[_FINGER_TIPS] < dist_to_wrist[_FINGER_MCPS]).all()
     
     # Check thumb is also bent/closed
-    thumb_bent = np.sqrt((thumb_tip.x - wrist.x)**2 + (thumb_tip.y - wrist.y)**2) < np.sqrt((thumb_ip.x - wrist.x)**2 + (thumb_ip.y - wrist.y)**2)
+    thumb_bent = dist_to_wrist[THUMB_TIP] < dist_to_wrist[THUMB_IP]
     
     # All conditions must be met for a proper closed fist
-    fingers_bent = index_bent and middle_bent and ring_bent and pinky_bent
-    fingers_close_to_wrist = index_closer_to_wrist and middle_closer_to_wrist and ring_closer_to_wrist and pinky_closer_to_wrist
-    
-    return fingers_bent and fingers_close_to_wrist and thumb_bent
+    return bool(fingers_bent and fingers_close_to_wrist and thumb_bent)
 
-def is_index_finger_only(hand_landmarks):
+def is_index_finger_only(hand_landmarks, dist_to_wrist=None):
     """
     Check if only the index finger is extended while all other fingers are closed.
     This version has been slightly relaxed to make it easier to perform the gesture.
     """
-    # Get landmarks for all fingers and wrist
-    wrist = hand_landmarks.landmark[mp_hands.HandLandmark.WRIST]
+    points = as_points(hand_landmarks)
     
-    # Index finger points
-    index_tip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
-    index_pip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_PIP]
-    index_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_MCP]
+    # Get landmarks for the index finger and thumb
+    index_tip = points[INDEX_FINGER_TIP]
+    index_mcp = points[INDEX_FINGER_MCP]
+    thumb_tip = points[THUMB_TIP]
     
-    # Middle finger points
-    middle_tip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-    middle_pip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_PIP]
-    middle_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_MCP]
+    # Middle, ring and pinky fingertips
+    other_tips = points[_OTHER_TIPS]
     
-    # Ring finger points
-    ring_tip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_TIP]
-    ring_pip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_PIP]
-    ring_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_MCP]
-    
-    # Pinky points
-    pinky_tip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_TIP]
-    pinky_pip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_PIP]
-    pinky_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_MCP]
-    
-    # Thumb points
-    thumb_tip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_TIP]
-    thumb_ip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_IP]
-    thumb_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_MCP]
-    
-    # Calculate distances from fingertips to wrist
-    dist_index_tip_to_wrist = np.sqrt((index_tip.x - wrist.x)**2 + (index_tip.y - wrist.y)**2)
-    dist_index_pip_to_wrist = np.sqrt((index_pip.x - wrist.x)**2 + (index_pip.y - wrist.y)**2)
-    
-    dist_middle_tip_to_wrist = np.sqrt((middle_tip.x - wrist.x)**2 + (middle_tip.y - wrist.y)**2)
-    dist_middle_pip_to_wrist = np.sqrt((middle_pip.x - wrist.x)**2 + (middle_pip.y - wrist.y)**2)
-    
-    dist_ring_tip_to_wrist = np.sqrt((ring_tip.x - wrist.x)**2 + (ring_tip.y - wrist.y)**2)
-    dist_ring_pip_to_wrist = np.sqrt((ring_pip.x - wrist.x)**2 + (ring_pip.y - wrist.y)**2)
-    
-    dist_pinky_tip_to_wrist = np.sqrt((pinky_tip.x - wrist.x)**2 + (pinky_tip.y - wrist.y)**2)
-    dist_pinky_pip_to_wrist = np.sqrt((pinky_pip.x - wrist.x)**2 + (pinky_pip.y - wrist.y)**2)
+    # Calculate squared distances from fingertips and PIPs to wrist (index, middle, ring, pinky)
+    if dist_to_wrist is None:
+        dist_to_wrist = wrist_distances_sq(points)
+    dist_tips_to_wrist = dist_to_wrist[_FINGER_TIPS]
+    dist_pips_to_wrist = dist_to_wrist[_FINGER_PIPS]
     
     # Check if index finger is extended - slightly relaxed condition
-    index_extended = dist_index_tip_to_wrist > dist_index_pip_to_wrist * 0.9
+    index_extended = dist_tips_to_wrist[0] > dist_pips_to_wrist[0] * 0.9 ** 2
     
     # Check if other fingers are bent
-    middle_bent = dist_middle_tip_to_wrist < dist_middle_pip_to_wrist
-    ring_bent = dist_ring_tip_to_wrist < dist_ring_pip_to_wrist
-    pinky_bent = dist_pinky_tip_to_wrist < dist_pinky_pip_to_wrist
+    other_fingers_bent = (dist_tips_to_wrist[1:] < dist_pips_to_wrist[1:]).all()
     
-    # Calculate distances from thumb tip to other finger tips and bases
-    thumb_to_middle_tip = np.sqrt((thumb_tip.x - middle_tip.x)**2 + (thumb_tip.y - middle_tip.y)**2)
-    thumb_to_ring_tip = np.sqrt((thumb_tip.x - ring_tip.x)**2 + (thumb_tip.y - ring_tip.y)**2)
-    thumb_to_pinky_tip = np.sqrt((thumb_tip.x - pinky_tip.x)**2 + (thumb_tip.y - pinky_tip.y)**2)
+    # Calculate squared distances from thumb tip to other finger tips
+    thumb_to_other_tips_sq = (thumb_tip[0] - other_tips[:, 0])**2 + (thumb_tip[1] - other_tips[:, 1])**2
     
     # Check if thumb is close to any of the bent fingers
     touch_threshold = 0.05
     thumb_touching_bent_fingers = (
-        thumb_to_middle_tip < touch_threshold or
-        thumb_to_ring_tip < touch_threshold or
-        thumb_to_pinky_tip < touch_threshold or
+        (thumb_to_other_tips_sq < touch_threshold ** 2).any() or
         # Allow thumb to be positioned near the palm
-        (thumb_tip.x > index_mcp.x - 0.05)  # For right-handed users, thumb is inside the palm
+        (thumb_tip[0] > index_mcp[0] - 0.05)  # For right-handed users, thumb is inside the palm
     )
     
     # Secondary condition: index fingertip's y coordinate should be higher than others
-    index_is_highest = (
-        index_tip.y < middle_tip.y - 0.05 and  # Restored to original 0.05
-        index_tip.y < ring_tip.y - 0.05 and    # Restored to original 0.05
-        index_tip.y < pinky_tip.y - 0.05       # Restored to original 0.05
-    )
+    index_is_highest = (index_tip[1] < other_tips[:, 1] - 0.05).all()
     
     # Final check: middle is bent
-    middle_really_bent = middle_tip.y > middle_pip.y * 0.95
+    middle_really_bent = points[MIDDLE_FINGER_TIP, 1] > points[MIDDLE_FINGER_PIP, 1] * 0.95
     
     # All conditions must be met
-    return (index_extended and 
-            middle_bent and ring_bent and pinky_bent and 
-            thumb_touching_bent_fingers and 
-            middle_really_bent and 
-            index_is_highest)
+    return bool(index_extended and 
+                other_fingers_bent and 
+                thumb_touching_bent_fingers and 
+                middle_really_bent and 
+                index_is_highest)
 
-def is_ok_gesture(hand_landmarks):
+def is_ok_gesture(hand_landmarks, dist_to_wrist=None):
     """
     Check if the hand is making an "OK" gesture:
     - Index finger and thumb form a circle (tips are close to each other)
     - Other three fingers (middle, ring, pinky) are extended
     """
+    points = as_points(hand_landmarks)
+    
     # Get finger landmarks
-    thumb_tip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_TIP]
-    index_tip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
-    index_pip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_PIP]
-    middle_tip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-    middle_pip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_PIP]
-    ring_tip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_TIP]
-    ring_pip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_PIP]
-    pinky_tip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_TIP]
-    pinky_pip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_PIP]
-    wrist = hand_landmarks.landmark[mp_hands.HandLandmark.WRIST]
+    thumb_tip_x, thumb_tip_y, thumb_tip_z = points[THUMB_TIP].tolist()
+    index_tip_x, index_tip_y, index_tip_z = points[INDEX_FINGER_TIP].tolist()
     
     # Check if index finger and thumb are forming a circle (tips close to each other)
     # Calculate the distance between index finger tip and thumb tip
-    thumb_index_distance = np.sqrt(
-        (thumb_tip.x - index_tip.x) ** 2 + 
-        (thumb_tip.y - index_tip.y) ** 2 + 
-        (thumb_tip.z - index_tip.z) ** 2
+    thumb_index_distance = math.hypot(
+        thumb_tip_x - index_tip_x, 
+        thumb_tip_y - index_tip_y, 
+        thumb_tip_z - index_tip_z
     )
     
     # Distance threshold to consider thumb and index are touching
@@ -420,57 +385,42 @@ def is_ok_gesture(hand_landmarks):
     
     # Check if middle, ring, and pinky fingers are extended
     # Use a combination of y-coordinate comparison and distance calculation
-    middle_extended = middle_tip.y < middle_pip.y
-    ring_extended = ring_tip.y < ring_pip.y
-    pinky_extended = pinky_tip.y < pinky_pip.y
+    other_extended = finger_extension_mask(points) & OTHER_FINGERS_EXTENDED == OTHER_FINGERS_EXTENDED
     
     # Additional checks for finger extension using distance
-    dist_middle_tip_to_wrist = np.sqrt((middle_tip.x - wrist.x)**2 + (middle_tip.y - wrist.y)**2)
-    dist_middle_pip_to_wrist = np.sqrt((middle_pip.x - wrist.x)**2 + (middle_pip.y - wrist.y)**2)
-    dist_ring_tip_to_wrist = np.sqrt((ring_tip.x - wrist.x)**2 + (ring_tip.y - wrist.y)**2)
-    dist_ring_pip_to_wrist = np.sqrt((ring_pip.x - wrist.x)**2 + (ring_pip.y - wrist.y)**2)
-    dist_pinky_tip_to_wrist = np.sqrt((pinky_tip.x - wrist.x)**2 + (pinky_tip.y - wrist.y)**2)
-    dist_pinky_pip_to_wrist = np.sqrt((pinky_pip.x - wrist.x)**2 + (pinky_pip.y - wrist.y)**2)
-    
-    middle_dist_extended = dist_middle_tip_to_wrist > dist_middle_pip_to_wrist
-    ring_dist_extended = dist_ring_tip_to_wrist > dist_ring_pip_to_wrist
-    pinky_dist_extended = dist_pinky_tip_to_wrist > dist_pinky_pip_to_wrist
+    if dist_to_wrist is None:
+        dist_to_wrist = wrist_distances_sq(points)
+    dist_other_tips_to_wrist = dist_to_wrist[_OTHER_TIPS]
+    dist_other_pips_to_wrist = dist_to_wrist[_OTHER_PIPS]
+    other_dist_extended = dist_other_tips_to_wrist > dist_other_pips_to_wrist
     
     # Final determination combining all checks
     thumb_index_circle = thumb_index_distance < touching_threshold
-    other_fingers_extended = (
-        (middle_extended and middle_dist_extended) and 
-        (ring_extended and ring_dist_extended) and 
-        (pinky_extended and pinky_dist_extended)
-    )
+    other_fingers_extended = other_extended and other_dist_extended.all()
     
-    return thumb_index_circle and other_fingers_extended
+    return bool(thumb_index_circle and other_fingers_extended)
 
-def is_alt_tab_ok_gesture(hand_landmarks):
+def is_alt_tab_ok_gesture(hand_landmarks, dist_to_wrist=None):
     """
     Check if the hand is making an "OK" gesture for Alt+Tab functionality
     This version is more relaxed than the standard OK gesture:
     - Index finger and thumb form a circle (tips are somewhat close to each other)
     - Only need 2 of 3 other fingers extended
     """
+    points = as_points(hand_landmarks)
+    
     # Get finger landmarks
-    thumb_tip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_TIP]
-    index_tip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
-    index_pip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_PIP]
-    middle_tip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-    middle_pip = hand_landmarks.landmark[mp_hands.HandLandmark.MIDDLE_FINGER_PIP]
-    ring_tip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_TIP]
-    ring_pip = hand_landmarks.landmark[mp_hands.HandLandmark.RING_FINGER_PIP]
-    pinky_tip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_TIP]
-    pinky_pip = hand_landmarks.landmark[mp_hands.HandLandmark.PINKY_PIP]
-    wrist = hand_landmarks.landmark[mp_hands.HandLandmark.WRIST]
+    thumb_tip_x, thumb_tip_y, thumb_tip_z = points[THUMB_TIP].tolist()
+    index_tip_x, index_tip_y, index_tip_z = points[INDEX_FINGER_TIP].tolist()
+    other_tips_y = points[_OTHER_TIPS, 1]
+    other_pips_y = points[_OTHER_PIPS, 1]
     
     # Check if index finger and thumb are forming a circle (tips close to each other)
     # Calculate the distance between index finger tip and thumb tip
-    thumb_index_distance = np.sqrt(
-        (thumb_tip.x - index_tip.x) ** 2 + 
-        (thumb_tip.y - index_tip.y) ** 2 + 
-        (thumb_tip.z - index_tip.z) ** 2
+    thumb_index_distance = math.hypot(
+        thumb_tip_x - index_tip_x, 
+        thumb_tip_y - index_tip_y, 
+        thumb_tip_z - index_tip_z
     )
     
     # More relaxed distance threshold for Alt+Tab OK gesture
@@ -478,40 +428,27 @@ def is_alt_tab_ok_gesture(hand_landmarks):
     
     # Check if middle, ring, and pinky fingers are extended
     # Use a combination of y-coordinate comparison and distance calculation
-    middle_extended = middle_tip.y < middle_pip.y * 1.05  # More relaxed condition
-    ring_extended = ring_tip.y < ring_pip.y * 1.05  # More relaxed condition
-    pinky_extended = pinky_tip.y < pinky_pip.y * 1.05  # More relaxed condition
+    other_extended = other_tips_y < other_pips_y * 1.05  # More relaxed condition
     
     # Additional checks for finger extension using distance
-    dist_middle_tip_to_wrist = np.sqrt((middle_tip.x - wrist.x)**2 + (middle_tip.y - wrist.y)**2)
-    dist_middle_pip_to_wrist = np.sqrt((middle_pip.x - wrist.x)**2 + (middle_pip.y - wrist.y)**2)
-    dist_ring_tip_to_wrist = np.sqrt((ring_tip.x - wrist.x)**2 + (ring_tip.y - wrist.y)**2)
-    dist_ring_pip_to_wrist = np.sqrt((ring_pip.x - wrist.x)**2 + (ring_pip.y - wrist.y)**2)
-    dist_pinky_tip_to_wrist = np.sqrt((pinky_tip.x - wrist.x)**2 + (pinky_tip.y - wrist.y)**2)
-    dist_pinky_pip_to_wrist = np.sqrt((pinky_pip.x - wrist.x)**2 + (pinky_pip.y - wrist.y)**2)
-    
-    middle_dist_extended = dist_middle_tip_to_wrist > dist_middle_pip_to_wrist * 0.9  # More relaxed
-    ring_dist_extended = dist_ring_tip_to_wrist > dist_ring_pip_to_wrist * 0.9  # More relaxed
-    pinky_dist_extended = dist_pinky_tip_to_wrist > dist_pinky_pip_to_wrist * 0.9  # More relaxed
+    if dist_to_wrist is None:
+        dist_to_wrist = wrist_distances_sq(points)
+    dist_other_tips_to_wrist = dist_to_wrist[_OTHER_TIPS]
+    dist_other_pips_to_wrist = dist_to_wrist[_OTHER_PIPS]
+    other_dist_extended = dist_other_tips_to_wrist > dist_other_pips_to_wrist * 0.9 ** 2  # More relaxed
     
     # Final determination with more relaxed conditions
     thumb_index_circle = thumb_index_distance < touching_threshold
     
     # Only 2 out of 3 fingers need to be extended (more relaxed)
-    middle_extended_final = middle_extended or middle_dist_extended
-    ring_extended_final = ring_extended or ring_dist_extended
-    pinky_extended_final = pinky_extended or pinky_dist_extended
-    
-    # Count extended fingers
-    extended_count = sum([middle_extended_final, ring_extended_final, pinky_extended_final])
+    extended_count = np.count_nonzero(other_extended | other_dist_extended)
     other_fingers_extended = extended_count >= 2  # Only need 2 out of 3 fingers extended
     
-    return thumb_index_circle and other_fingers_extended
+    return bool(thumb_index_circle and other_fingers_extended)
 
-def update_all_cooldowns(gesture_states, fps):
-    """Update all gesture state cooldowns - no longer needed with time-based timing"""
-    # Time-based timing doesn't require updates, cooldowns are checked on demand
-    pass
+def update_frame_time():
+    """Read the clock once for the current frame, all gesture timers use this timestamp"""
+    GestureState.now = time.monotonic()
 
 def reset_all_gesture_states(gesture_states):
     """Reset all gesture states when no hand is detected"""
@@ -6,54 +6,77 @@ Mouse clicking gesture module for clicking the mouse while controlling the curso
 """
 
 import cv2
-import time
-from config import mouse
+from config import mouse, DRAW_OVERLAY
 from pynput.mouse import Button
-from gestures.base import GestureState
+from gestures.base import GestureState, as_points, is_ok_gesture
+from overlay import draw_text
 
 # Create state for mouse click gesture
 mouse_click_state = GestureState()
 
-def process_mouse_click_gesture(image, hand_landmarks, fps, image_width, image_height):
+# Confirmation progress messages for every percentage, built once
+CONFIRMING_TEXTS = tuple(f"Confirming mouse click: {percent}%" for percent in range(101))
+
+def process_mouse_click_gesture(image, hand_landmarks, fps, image_width, image_height, is_valid_gesture=None):
     """Process OK gesture to trigger mouse clicks"""
-    global mouse_click_state
+    # State is mutated in place, so it never needs to be written back
     state = mouse_click_state
     
-    # Check if gesture is still valid (is_ok_gesture needs to be imported)
-    from gestures.base import is_ok_gesture
-    is_valid_gesture = is_ok_gesture(hand_landmarks)
+    # Timestamp of the current frame, used for every timing check below
+    current_time = state.now
+    
+    # While a click is cooling down no new click can fire, so when the caller
+    # left the gesture unchecked (main.py only matched the finger pattern)
+    # skip the full OK check and just keep the confirmation timer going,
+    # the next click then comes as soon as it did with the check
+    in_cooldown = current_time - state.cooldown_start_time < state.cooldown_duration
+    if in_cooldown and is_valid_gesture is None:
+        if state.gesture_confirmation_start_time == 0:
+            state.start_gesture_confirmation()
+        
+        remaining_cooldown = state.cooldown_duration - (current_time - state.cooldown_start_time)
+        draw_text(
+            image, 
+            f"Click cooldown: {remaining_cooldown:.1f}s", 
+            (10, 150), 
+            0.7, 
+            (255, 165, 0), 
+            2
+        )
+        
+        state.gesture_active = True
+        return image
+    
+    # Check if gesture is still valid, unless the caller already checked it
+    if is_valid_gesture is None:
+        is_valid_gesture = is_ok_gesture(hand_landmarks)
     
     # If gesture was confirmed but is no longer valid, cancel it
     if state.confirmed_gesture and not is_valid_gesture:
         state.confirmed_gesture = False
         state.gesture_confirmation_start_time = 0
         
-        cv2.putText(
+        draw_text(
             image, 
             "Mouse click canceled", 
             (10, 150), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (0, 0, 255), 
             2
         )
         
-        # Update state and return
-        mouse_click_state = state
         return image
 
     # Process confirmed gesture
     if state.confirmed_gesture and is_valid_gesture:
         # Check if we're in cooldown after a recent click
-        current_time = time.time()
-        if current_time - state.cooldown_start_time < state.cooldown_duration:
+        if in_cooldown:
             remaining_cooldown = state.cooldown_duration - (current_time - state.cooldown_start_time)
             
-            cv2.putText(
+            draw_text(
                 image, 
                 f"Click cooldown: {remaining_cooldown:.1f}s", 
                 (10, 150), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
                 0.7, 
                 (255, 165, 0), 
                 2
@@ -62,11 +85,10 @@ def process_mouse_click_gesture(image, hand_landmarks, fps, image_width, image_h
             # Perform click
             mouse.click(Button.left)
             
-            cv2.putText(
+            draw_text(
                 image, 
                 "LEFT CLICK!", 
                 (10, 150), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
                 0.9, 
                 (0, 0, 255), 
                 2
@@ -88,40 +110,36 @@ def process_mouse_click_gesture(image, hand_landmarks, fps, image_width, image_h
             state.start_gesture_confirmation()
         
         # Calculate confirmation progress
-        current_time = time.time()
-        elapsed_time = current_time - state.gesture_confirmation_start_time
-        confirmation_percent = min(100, int((elapsed_time / state.gesture_confirmation_time) * 100))
+        confirmation_percent = state.confirmation_percent()
         
         # Get thumb and index finger tips for visualization
-        thumb_tip = hand_landmarks.landmark[4]  # THUMB_TIP
-        index_tip = hand_landmarks.landmark[8]  # INDEX_FINGER_TIP
+        (thumb_tip_x, thumb_tip_y), (index_tip_x, index_tip_y) = as_points(hand_landmarks)[[4, 8], :2].tolist()  # THUMB_TIP, INDEX_FINGER_TIP
         
-        thumb_x = int(thumb_tip.x * image_width)
-        thumb_y = int(thumb_tip.y * image_height)
-        index_x = int(index_tip.x * image_width)
-        index_y = int(index_tip.y * image_height)
+        thumb_x = int(thumb_tip_x * image_width)
+        thumb_y = int(thumb_tip_y * image_height)
+        index_x = int(index_tip_x * image_width)
+        index_y = int(index_tip_y * image_height)
         
         # Draw OK gesture indicator
-        cv2.circle(image, (thumb_x, thumb_y), 8, (255, 0, 255), -1)
-        cv2.circle(image, (index_x, index_y), 8, (255, 0, 255), -1)
-        cv2.line(image, (thumb_x, thumb_y), (index_x, index_y), (255, 0, 255), 3)
+        if DRAW_OVERLAY:
+            cv2.circle(image, (thumb_x, thumb_y), 8, (255, 0, 255), -1)
+            cv2.circle(image, (index_x, index_y), 8, (255, 0, 255), -1)
+            cv2.line(image, (thumb_x, thumb_y), (index_x, index_y), (255, 0, 255), 3)
         
-        cv2.putText(
+        draw_text(
             image, 
             "OK", 
             ((thumb_x + index_x) // 2 - 10, (thumb_y + index_y) // 2 - 10), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.6, 
             (255, 0, 255), 
             2
         )
         
         # Display confirmation progress
-        cv2.putText(
+        draw_text(
             image, 
-            f"Confirming mouse click: {confirmation_percent}%", 
+            CONFIRMING_TEXTS[confirmation_percent], 
             (10, 150), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (255, 255, 0), 
             2
@@ -131,11 +149,10 @@ def process_mouse_click_gesture(image, hand_landmarks, fps, image_width, image_h
         if state.is_gesture_confirmed():
             state.confirmed_gesture = True
             
-            cv2.putText(
+            draw_text(
                 image, 
                 "Mouse Click Confirmed!", 
                 (10, 190), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
                 0.7, 
                 (0, 255, 0), 
                 2
@@ -146,11 +163,10 @@ def process_mouse_click_gesture(image, hand_landmarks, fps, image_width, image_h
         
         # If we were in the middle of an active gesture, reset it
         if state.confirmed_gesture:
-            cv2.putText(
+            draw_text(
                 image, 
                 "Mouse click ended", 
                 (10, 150), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
                 0.7, 
                 (0, 255, 255), 
                 2
@@ -159,6 +175,4 @@ def process_mouse_click_gesture(image, hand_landmarks, fps, image_width, image_h
             # Reset click state
             state.reset()
     
-    # Update state
-    mouse_click_state = state
     return image
@@ -5,68 +5,61 @@
 Mouse control gesture module for controlling cursor using index finger
 """
 
-import cv2
-import time
 from config import mouse
-from gestures.base import GestureState
+from gestures.base import GestureState, as_points, is_index_finger_only
+from overlay import draw_text, draw_glyph_text, draw_sprite, make_cursor_sprite
 
 # Create state for mouse control gesture
 mouse_state = GestureState()
 
-def process_mouse_control_gesture(image, hand_landmarks, fps, image_width, image_height):
+# Cursor indicators (circle and label) rendered once, anchored at the fingertip
+_CURSOR_SPRITE = make_cursor_sprite(10, "CURSOR", (-20, -15), 0.5, (0, 255, 0), 2)
+_PREVIEW_SPRITE = make_cursor_sprite(8, "PREVIEW", (-25, -15), 0.4, (0, 165, 255), 1)
+
+# Confirmation progress messages for every percentage, built once
+CONFIRMING_TEXTS = tuple(f"Confirming mouse control: {percent}%" for percent in range(101))
+
+def process_mouse_control_gesture(image, hand_landmarks, fps, image_width, image_height, is_valid_gesture=None):
     """Process index finger only gesture to control the mouse cursor"""
-    global mouse_state
     state = mouse_state
     
-    # Check if gesture is still valid (is_index_finger_only needs to be imported)
-    from gestures.base import is_index_finger_only
-    is_valid_gesture = is_index_finger_only(hand_landmarks)
+    # Check if gesture is still valid, unless the caller already checked it
+    if is_valid_gesture is None:
+        is_valid_gesture = is_index_finger_only(hand_landmarks)
     
     # If gesture was confirmed but is no longer valid, cancel it
     if state.confirmed_gesture and not is_valid_gesture:
         state.confirmed_gesture = False
         state.gesture_confirmation_start_time = 0
         
-        cv2.putText(
+        draw_text(
             image, 
             "Mouse control canceled", 
             (10, 70), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (0, 0, 255), 
             2
         )
         
-        # Update state and return
-        mouse_state = state
         return image
 
+    # Get index finger tip position once for both the active and preview branches
+    if is_valid_gesture:
+        tip_x, tip_y = as_points(hand_landmarks)[8, :2].tolist()  # INDEX_FINGER_TIP
+
     # Process confirmed gesture
     if state.confirmed_gesture and is_valid_gesture:
-        # Get index finger tip position
-        index_tip = hand_landmarks.landmark[8]  # INDEX_FINGER_TIP
-        
         # Convert to screen coordinates
-        current_x = index_tip.x * image_width
-        current_y = index_tip.y * image_height
+        current_x = tip_x * image_width
+        current_y = tip_y * image_height
         
         # Draw cursor indicator
-        cv2.circle(image, (int(current_x), int(current_y)), 10, (0, 255, 0), -1)
-        cv2.putText(
-            image, 
-            "CURSOR", 
-            (int(current_x) - 20, int(current_y) - 15), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            0.5, 
-            (0, 255, 0), 
-            2
-        )
+        draw_sprite(image, _CURSOR_SPRITE, (int(current_x), int(current_y)))
         
-        cv2.putText(
+        draw_text(
             image, 
             "Mouse Control Active", 
             (10, 70), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (0, 255, 0), 
             2
@@ -74,34 +67,48 @@ def process_mouse_control_gesture(image, hand_landmarks, fps, image_width, image
         
         # Convert gesture coordinates to screen coordinates
         # Use direct mapping for natural control
-        screen_x = index_tip.x * state.screen_width
-        screen_y = index_tip.y * state.screen_height
-        
-        # Apply smoothing for more stable cursor movement
-        if hasattr(state, 'smooth_x') and hasattr(state, 'smooth_y'):
-            state.smooth_x = state.smooth_x * state.smoothing_factor + screen_x * (1 - state.smoothing_factor)
-            state.smooth_y = state.smooth_y * state.smoothing_factor + screen_y * (1 - state.smoothing_factor)
+        screen_x = tip_x * state.screen_width
+        screen_y = tip_y * state.screen_height
+        
+        # While the fingertip is held still and the smoothed position has
+        # already settled on it (less than a screen pixel apart), keep the
+        # cursor where it is and skip the smoothing and mouse update
+        last_position = state.last_mouse_position
+        if (last_position is not None and
+                (abs(screen_x - state.smooth_x) + abs(screen_y - state.smooth_y)) *
+                state.sensitivity_multiplier < 1):
+            final_x, final_y = last_position
         else:
-            state.smooth_x = screen_x
-            state.smooth_y = screen_y
-        
-        # Apply sensitivity multiplier
-        final_x = state.smooth_x * state.sensitivity_multiplier
-        final_y = state.smooth_y * state.sensitivity_multiplier
-        
-        # Ensure coordinates are within screen bounds
-        final_x = max(0, min(state.screen_width - 1, final_x))
-        final_y = max(0, min(state.screen_height - 1, final_y))
-        
-        # Move mouse cursor
-        mouse.position = (final_x, final_y)
+            # Apply smoothing for more stable cursor movement
+            if state.smooth_x is not None:
+                smoothing_factor = state.smoothing_factor
+                new_weight = 1 - smoothing_factor
+                state.smooth_x = state.smooth_x * smoothing_factor + screen_x * new_weight
+                state.smooth_y = state.smooth_y * smoothing_factor + screen_y * new_weight
+            else:
+                state.smooth_x = screen_x
+                state.smooth_y = screen_y
+        
+            # Apply sensitivity multiplier
+            final_x = state.smooth_x * state.sensitivity_multiplier
+            final_y = state.smooth_y * state.sensitivity_multiplier
+        
+            # Ensure coordinates are within screen bounds
+            final_x = max(0, min(state.screen_width - 1, final_x))
+            final_y = max(0, min(state.screen_height - 1, final_y))
+        
+            # Move mouse cursor, skipping the OS call while the position hasn't
+            # moved by at least a pixel since the last write
+            if (last_position is None or
+                    abs(final_x - last_position[0]) + abs(final_y - last_position[1]) >= 1):
+                mouse.position = (final_x, final_y)
+                state.last_mouse_position = (final_x, final_y)
         
         # Display coordinates
-        cv2.putText(
+        draw_glyph_text(
             image, 
             f"Screen: ({final_x:.0f}, {final_y:.0f})", 
             (10, 110), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (255, 255, 255), 
             2
@@ -116,33 +123,20 @@ def process_mouse_control_gesture(image, hand_landmarks, fps, image_width, image
             state.start_gesture_confirmation()
         
         # Calculate confirmation progress
-        current_time = time.time()
-        elapsed_time = current_time - state.gesture_confirmation_start_time
-        confirmation_percent = min(100, int((elapsed_time / state.gesture_confirmation_time) * 100))
+        confirmation_percent = state.confirmation_percent()
         
-        # Get index finger tip position for preview
-        index_tip = hand_landmarks.landmark[8]
-        preview_x = index_tip.x * image_width
-        preview_y = index_tip.y * image_height
+        # Index finger tip position for preview
+        preview_x = tip_x * image_width
+        preview_y = tip_y * image_height
         
         # Draw preview cursor (orange color)
-        cv2.circle(image, (int(preview_x), int(preview_y)), 8, (0, 165, 255), -1)
-        cv2.putText(
-            image, 
-            "PREVIEW", 
-            (int(preview_x) - 25, int(preview_y) - 15), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            0.4, 
-            (0, 165, 255), 
-            1
-        )
+        draw_sprite(image, _PREVIEW_SPRITE, (int(preview_x), int(preview_y)))
         
         # Display confirmation progress
-        cv2.putText(
+        draw_text(
             image, 
-            f"Confirming mouse control: {confirmation_percent}%", 
+            CONFIRMING_TEXTS[confirmation_percent], 
             (10, 70), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (255, 255, 0), 
             2
@@ -152,11 +146,10 @@ def process_mouse_control_gesture(image, hand_landmarks, fps, image_width, image
         if state.is_gesture_confirmed():
             state.confirmed_gesture = True
             
-            cv2.putText(
+            draw_text(
                 image, 
                 "Mouse Control Confirmed!", 
                 (10, 110), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
                 0.7, 
                 (0, 255, 0), 
                 2
@@ -167,11 +160,10 @@ def process_mouse_control_gesture(image, hand_landmarks, fps, image_width, image
         
         # If we were in the middle of an active gesture, reset it
         if state.confirmed_gesture:
-            cv2.putText(
+            draw_text(
                 image, 
                 "Mouse control ended", 
                 (10, 70), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
                 0.7, 
                 (0, 255, 255), 
                 2
@@ -180,6 +172,4 @@ def process_mouse_control_gesture(image, hand_landmarks, fps, image_width, image
             # Reset mouse control state
             state.reset()
     
-    # Update state
-    mouse_state = state
     return image
@@ -5,42 +5,41 @@
 Navigation gesture module for controlling left/right arrow keys
 """
 
-import cv2
-import time
 from pynput.keyboard import Key
-from config import keyboard
-from gestures.base import GestureState, is_navigation_gesture
+from config import tap_key
+from gestures.base import GestureState, as_points, is_navigation_gesture
+from overlay import draw_text, draw_glyph_text
 
 # Create state for navigation gesture
 navigation_state = GestureState()
 
-def process_navigation_gesture(image, hand_landmarks, fps, image_width, image_height):
+# Confirmation progress messages for every percentage, built once
+CONFIRMING_TEXTS = tuple(f"Confirming navigation gesture: {percent}%" for percent in range(101))
+
+def process_navigation_gesture(image, hand_landmarks, fps, image_width, image_height, is_valid_gesture=None):
     """Process navigation gesture (index and middle finger extended) to control left/right keys"""
-    global navigation_state
     state = navigation_state
     
     # Check if we're in cooldown period after a successful navigation gesture
     if state.is_cooldown_active():
-        current_time = time.time()
+        current_time = state.now
         remaining_cooldown = max(0, state.gesture_cooldown_time - (current_time - state.gesture_cooldown_start_time))
         
         # Display cooldown message
-        cv2.putText(
+        draw_text(
             image, 
             f"Navigation cooldown: {remaining_cooldown:.1f}s", 
             (10, 70), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (255, 165, 0), 
             2
         )
         
-        # Update state and return early
-        navigation_state = state
         return image
     
-    # Check if gesture is still valid
-    is_valid_gesture = is_navigation_gesture(hand_landmarks)
+    # Check if gesture is still valid, unless the caller already checked it
+    if is_valid_gesture is None:
+        is_valid_gesture = is_navigation_gesture(hand_landmarks)
     
     # If gesture was confirmed but is no longer valid, cancel it
     if state.confirmed_gesture and not is_valid_gesture:
@@ -49,47 +48,45 @@ def process_navigation_gesture(image, hand_landmarks, fps, image_width, image_he
         state.prev_x = None
         
         # Display cancellation message
-        cv2.putText(
+        draw_text(
             image, 
             "Navigation gesture cancelled: Invalid gesture", 
             (10, 70), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (0, 0, 255), 
             2
         )
         
-        # Update state and return
-        navigation_state = state
         return image
     
+    # Horizontal hand position (between index and middle finger tips),
+    # read once for both the tracking and the confirmation branch
+    if is_valid_gesture:
+        points = as_points(hand_landmarks)
+        index_tip_x, middle_tip_x = points[[8, 12], 0].tolist()  # INDEX_FINGER_TIP, MIDDLE_FINGER_TIP
+        current_x = (index_tip_x + middle_tip_x) / 2 * image_width
+    
     # If gesture was confirmed, track movement
     if state.confirmed_gesture:
-        index_tip = hand_landmarks.landmark[8]  # INDEX_FINGER_TIP
-        middle_tip = hand_landmarks.landmark[12]  # MIDDLE_FINGER_TIP
-        current_x = (index_tip.x + middle_tip.x) / 2 * image_width
-        
         # Display active gesture status
-        cv2.putText(
+        draw_text(
             image, 
             "Navigation Gesture Active", 
             (10, 70), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (0, 255, 0), 
             2
         )
           # Only track movement if we have a previous position and not in brief cooldown
-        current_time = time.time()
+        current_time = state.now
         if state.prev_x is not None and not (current_time - state.cooldown_start_time < state.cooldown_duration):
             x_movement = state.prev_x - current_x
             
             # Display movement direction and magnitude
-            cv2.putText(
+            draw_glyph_text(
                 image, 
                 f"Move: {x_movement:.1f}", 
                 (10, 110), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
                 0.7, 
                 (255, 0, 0), 
                 2
@@ -98,20 +95,19 @@ def process_navigation_gesture(image, hand_landmarks, fps, image_width, image_he
             # Determine gesture direction for significant movements
             if abs(x_movement) > state.movement_threshold:
                 if x_movement > 0:  # Right to left movement
-                    cv2.putText(
+                    draw_text(
                         image, 
                         "RIGHT key pressed", 
                         (10, 150), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 
                         0.9, 
                         (0, 0, 255), 
                         2
                     )
-                    keyboard.press(Key.right)
-                    keyboard.release(Key.right)
+                    tap_key(Key.right)
                     
                     # Start cooldown periods after action
-                    state.start_cooldown(0.2)  # Brief cooldown after key press                    state.start_gesture_cooldown()  # Main cooldown for gesture 
+                    state.start_cooldown(0.2)  # Brief cooldown after key press
+                    state.start_gesture_cooldown()  # Main cooldown for gesture
                     
                     # Reset the gesture detection process
                     state.confirmed_gesture = False
@@ -119,17 +115,15 @@ def process_navigation_gesture(image, hand_landmarks, fps, image_width, image_he
                     state.prev_x = None
                     
                 elif x_movement < 0:  # Left to right movement
-                    cv2.putText(
+                    draw_text(
                         image, 
                         "LEFT key pressed", 
                         (10, 150), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 
                         0.9, 
                         (0, 0, 255), 
                         2
                     )
-                    keyboard.press(Key.left)
-                    keyboard.release(Key.left)
+                    tap_key(Key.left)
                     
                     # Start cooldown periods after action
                     state.start_cooldown(0.2)  # Brief cooldown after key press
@@ -150,16 +144,13 @@ def process_navigation_gesture(image, hand_landmarks, fps, image_width, image_he
             state.start_gesture_confirmation()
         
         # Calculate confirmation progress
-        current_time = time.time()
-        elapsed_time = current_time - state.gesture_confirmation_start_time
-        confirmation_percent = min(100, int((elapsed_time / state.gesture_confirmation_time) * 100))
+        confirmation_percent = state.confirmation_percent()
         
         # Display confirmation progress
-        cv2.putText(
+        draw_text(
             image, 
-            f"Confirming navigation gesture: {confirmation_percent}%", 
+            CONFIRMING_TEXTS[confirmation_percent], 
             (10, 70), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (255, 255, 0), 
             2
@@ -169,15 +160,12 @@ def process_navigation_gesture(image, hand_landmarks, fps, image_width, image_he
         if state.is_gesture_confirmed():
             state.confirmed_gesture = True
             # Get initial position once gesture is confirmed
-            index_tip = hand_landmarks.landmark[8]  # INDEX_FINGER_TIP
-            middle_tip = hand_landmarks.landmark[12]  # MIDDLE_FINGER_TIP
-            state.prev_x = (index_tip.x + middle_tip.x) / 2 * image_width
+            state.prev_x = current_x
             
-            cv2.putText(
+            draw_text(
                 image, 
                 "Navigation Gesture Confirmed!", 
                 (10, 110), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
                 0.7, 
                 (0, 255, 0), 
                 2
@@ -186,6 +174,4 @@ def process_navigation_gesture(image, hand_landmarks, fps, image_width, image_he
         # Reset confirmation timer if gesture is not valid
         state.gesture_confirmation_start_time = 0
     
-    # Update state
-    navigation_state = state
     return image
\ No newline at end of file
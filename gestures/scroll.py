@@ -7,45 +7,71 @@ Only allows vertical scrolling with reference point tracking
 """
 
 import cv2
-import time
-import numpy as np
-from pynput.mouse import Button, Controller
 from config import mouse
-from gestures.base import GestureState, is_scroll_gesture
+from gestures.base import GestureState, as_points, is_scroll_gesture
+from overlay import FONT, draw_text, draw_glyph_text, draw_sprite, make_sprite
 
 # Create state for scroll gesture
 scroll_state = GestureState()
 
-def process_scroll_gesture(image, hand_landmarks, fps, image_width, image_height):
+# Confirmation progress messages for every percentage, built once
+CONFIRMING_TEXTS = tuple(f"Confirming scroll gesture: {percent}%" for percent in range(101))
+
+# Scroll direction messages keyed by the signed scroll amount (-5 to 5, except 0)
+SCROLL_TEXTS = {
+    amount: f"SCROLL {'UP' if amount > 0 else 'DOWN'} (intensity: {abs(amount)})"
+    for amount in range(-5, 6) if amount
+}
+
+# Weight of the newest hand position in the smoothed vertical position
+SCROLL_SMOOTHING_ALPHA = 0.4
+
+def _draw_reference_marker(canvas, center):
+    """Yellow dot with a black outline and a "REF" label"""
+    cv2.circle(canvas, center, 15, (0, 255, 255), -1)  # Yellow filled circle
+    cv2.circle(canvas, center, 15, (0, 0, 0), 2)  # Black outline
+    cv2.putText(canvas, "REF", (center[0] - 15, center[1] + 5), FONT, 0.5, (0, 0, 0), 2)
+
+def _draw_position_marker(canvas, center):
+    """Green dot for the current hand position"""
+    cv2.circle(canvas, center, 8, (0, 255, 0), -1)
+
+# Markers rendered once, anchored at the point they mark
+_REFERENCE_SPRITE = make_sprite(80, 60, (30, 30), _draw_reference_marker)
+_POSITION_SPRITE = make_sprite(20, 20, (10, 10), _draw_position_marker)
+
+def _hand_center(hand_landmarks, image_width, image_height):
+    """Image position midway between the thumb and index finger tips"""
+    (thumb_tip_x, thumb_tip_y), (index_tip_x, index_tip_y) = as_points(hand_landmarks)[[4, 8], :2].tolist()  # THUMB_TIP, INDEX_FINGER_TIP
+    return (thumb_tip_x + index_tip_x) / 2 * image_width, (thumb_tip_y + index_tip_y) / 2 * image_height
+
+def process_scroll_gesture(image, hand_landmarks, fps, image_width, image_height, is_valid_gesture=None):
     """
     Process scroll gesture (thumb and index finger extended in L/V shape, other fingers bent)
     to control vertical scrolling only, with reference point visualization
     """
-    global scroll_state
     state = scroll_state
     
     # Check if we're in cooldown period after a successful scroll gesture
     if state.is_cooldown_active():
-        current_time = time.time()
+        current_time = state.now
         remaining_cooldown = max(0, state.gesture_cooldown_time - (current_time - state.gesture_cooldown_start_time))
         
         # Display cooldown message
-        cv2.putText(
+        draw_text(
             image, 
             f"Scroll cooldown: {remaining_cooldown:.1f}s", 
             (10, 310), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (255, 165, 0), 
             2
         )
         
-        # Update state and return early
-        scroll_state = state
         return image
     
-    # Check if gesture is still valid
-    is_valid_gesture = is_scroll_gesture(hand_landmarks)
+    # Check if gesture is still valid, unless the caller already checked it
+    if is_valid_gesture is None:
+        is_valid_gesture = is_scroll_gesture(hand_landmarks)
     
     # If gesture was confirmed but is no longer valid, cancel it
     if state.confirmed_gesture and not is_valid_gesture:
@@ -54,71 +80,58 @@ def process_scroll_gesture(image, hand_landmarks, fps, image_width, image_height
         state.prev_y = None
         state.scroll_orientation = None
         
-        cv2.putText(
+        draw_text(
             image, 
             "Scroll gesture canceled", 
             (10, 310), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (0, 0, 255), 
             2
         )
         
-        # Update state and return
-        scroll_state = state
         return image
 
     # Process confirmed gesture
     if state.confirmed_gesture and is_valid_gesture:
-        # Get thumb and index finger tips for movement calculation
-        thumb_tip = hand_landmarks.landmark[4]  # THUMB_TIP
-        index_tip = hand_landmarks.landmark[8]  # INDEX_FINGER_TIP
-        
         # Calculate current position between thumb and index finger
-        current_center_x = (thumb_tip.x + index_tip.x) / 2 * image_width
-        current_center_y = (thumb_tip.y + index_tip.y) / 2 * image_height
+        current_center_x, current_center_y = _hand_center(hand_landmarks, image_width, image_height)
+        
+        # Smooth the vertical position to filter out frame-to-frame landmark noise
+        if state.smooth_y is not None:
+            state.smooth_y = (SCROLL_SMOOTHING_ALPHA * current_center_y + 
+                              (1 - SCROLL_SMOOTHING_ALPHA) * state.smooth_y)
+        else:
+            state.smooth_y = current_center_y
         
         # Draw fixed reference point (if exists)
-        if hasattr(state, 'reference_x') and hasattr(state, 'reference_y'):
-            cv2.circle(image, (int(state.reference_x), int(state.reference_y)), 15, (0, 255, 255), -1)  # Yellow filled circle
-            cv2.circle(image, (int(state.reference_x), int(state.reference_y)), 15, (0, 0, 0), 2)  # Black outline
-            
-            cv2.putText(
-                image, 
-                "REF", 
-                (int(state.reference_x) - 15, int(state.reference_y) + 5), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
-                0.5, 
-                (0, 0, 0), 
-                2
-            )
+        if state.reference_x is not None:
+            draw_sprite(image, _REFERENCE_SPRITE, (int(state.reference_x), int(state.reference_y)))
         
         # Draw current hand position
-        cv2.circle(image, (int(current_center_x), int(current_center_y)), 8, (0, 255, 0), -1)  # Green current position
+        draw_sprite(image, _POSITION_SPRITE, (int(current_center_x), int(current_center_y)))
         
-        cv2.putText(
+        draw_text(
             image, 
             "Scroll Gesture Active - Move vertically from reference point", 
             (10, 310), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (0, 255, 0), 
             2
         )
         
         # Track movement for scrolling (only vertical, relative to reference point)
-        current_time = time.time()
-        if (hasattr(state, 'reference_y') and 
+        current_time = state.now
+        if (state.reference_y is not None and 
             not (current_time - state.cooldown_start_time < state.cooldown_duration)):
             
-            y_movement = state.reference_y - current_center_y
+            # Landmark jitter is already kept below movement_threshold by the smoothing
+            y_movement = state.reference_y - state.smooth_y
             
             # Display movement relative to reference
-            cv2.putText(
+            draw_glyph_text(
                 image, 
                 f"Y Move from ref: {y_movement:.1f}", 
                 (10, 350), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
                 0.7, 
                 (255, 0, 0), 
                 2
@@ -131,37 +144,21 @@ def process_scroll_gesture(image, hand_landmarks, fps, image_width, image_height
                 # Calculate scroll intensity based on movement magnitude
                 scroll_intensity = max(1, min(5, int(abs_y_movement / 15)))
                 
-                if y_movement > 0:  # Upward movement from reference
-                    cv2.putText(
-                        image, 
-                        f"SCROLL UP (intensity: {scroll_intensity})", 
-                        (10, 390), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 
-                        0.9, 
-                        (0, 255, 0), 
-                        2
-                    )
-                    # Scroll up
-                    mouse.scroll(0, scroll_intensity)
-                    
-                    # Brief cooldown to prevent too rapid scrolling
-                    state.start_cooldown(max(0.05, 0.1 / scroll_intensity))
-                    
-                elif y_movement < 0:  # Downward movement from reference
-                    cv2.putText(
-                        image, 
-                        f"SCROLL DOWN (intensity: {scroll_intensity})", 
-                        (10, 390), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 
-                        0.9, 
-                        (0, 255, 0), 
-                        2
-                    )
-                    # Scroll down
-                    mouse.scroll(0, -scroll_intensity)
-                    
-                    # Brief cooldown to prevent too rapid scrolling
-                    state.start_cooldown(max(0.05, 0.1 / scroll_intensity))
+                # Upward movement from reference scrolls up, downward scrolls down
+                scroll_amount = scroll_intensity if y_movement > 0 else -scroll_intensity
+                
+                draw_text(
+                    image, 
+                    SCROLL_TEXTS[scroll_amount], 
+                    (10, 390), 
+                    0.9, 
+                    (0, 255, 0), 
+                    2
+                )
+                mouse.scroll(0, scroll_amount)
+                
+                # Brief cooldown to prevent too rapid scrolling
+                state.start_cooldown(max(0.05, 0.1 / scroll_intensity))
         
         state.gesture_active = True
         
@@ -172,16 +169,13 @@ def process_scroll_gesture(image, hand_landmarks, fps, image_width, image_height
             state.start_gesture_confirmation()
         
         # Calculate confirmation progress
-        current_time = time.time()
-        elapsed_time = current_time - state.gesture_confirmation_start_time
-        confirmation_percent = min(100, int((elapsed_time / state.gesture_confirmation_time) * 100))
+        confirmation_percent = state.confirmation_percent()
         
         # Display confirmation progress
-        cv2.putText(
+        draw_text(
             image, 
-            f"Confirming scroll gesture: {confirmation_percent}%", 
+            CONFIRMING_TEXTS[confirmation_percent], 
             (10, 310), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (255, 255, 0), 
             2
@@ -191,16 +185,13 @@ def process_scroll_gesture(image, hand_landmarks, fps, image_width, image_height
         if state.is_gesture_confirmed():
             state.confirmed_gesture = True
             # Set fixed reference point once gesture is confirmed
-            thumb_tip = hand_landmarks.landmark[4]  # THUMB_TIP
-            index_tip = hand_landmarks.landmark[8]  # INDEX_FINGER_TIP
-            state.reference_x = (thumb_tip.x + index_tip.x) / 2 * image_width
-            state.reference_y = (thumb_tip.y + index_tip.y) / 2 * image_height
+            state.reference_x, state.reference_y = _hand_center(hand_landmarks, image_width, image_height)
+            state.smooth_y = state.reference_y
             
-            cv2.putText(
+            draw_text(
                 image, 
                 "Scroll Gesture Confirmed! Reference point set.", 
                 (10, 350), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
                 0.7, 
                 (0, 255, 0), 
                 2
@@ -211,11 +202,10 @@ def process_scroll_gesture(image, hand_landmarks, fps, image_width, image_height
         
         # If we were in the middle of an active gesture, start cooldown
         if state.confirmed_gesture:
-            cv2.putText(
+            draw_text(
                 image, 
                 "Scroll gesture ended", 
                 (10, 310), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
                 0.7, 
                 (0, 255, 255), 
                 2
@@ -227,6 +217,4 @@ def process_scroll_gesture(image, hand_landmarks, fps, image_width, image_height
             # Start gesture cooldown to prevent immediate re-triggering
             state.start_gesture_cooldown()
     
-    # Update state
-    scroll_state = state
     return image
@@ -6,48 +6,57 @@ Voice command gesture module
 Uses closed hand gesture to trigger voice recording and processing
 """
 
-import cv2
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from gestures.base import GestureState, is_closed_hand
+from overlay import draw_text, draw_glyph_text
 
 # Create state for voice command gesture
 voice_command_state = GestureState()
 
-def process_voice_command_gesture(image, hand_landmarks, fps, image_width, image_height):
+# Single background worker that starts voice recordings, so importing the
+# voice modules and opening the audio device never stall the frame loop
+_voice_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voice-trigger")
+
+# Future of the trigger currently queued or running, None if there is none
+_voice_trigger = None
+
+def process_voice_command_gesture(image, hand_landmarks, fps, image_width, image_height, is_valid_gesture=None):
     """
     Process closed hand gesture to trigger voice command recording
     """
-    global voice_command_state
+    global _voice_trigger
     state = voice_command_state
     
     # Check if we're in cooldown period
     if state.is_cooldown_active():
-        current_time = time.time()
+        current_time = state.now
         remaining_cooldown = max(0, state.gesture_cooldown_time - (current_time - state.gesture_cooldown_start_time))
         
-        cv2.putText(
+        draw_text(
             image, 
             f"Voice cooldown: {remaining_cooldown:.1f}s", 
             (10, 430), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (255, 165, 0),  # Orange
             2
         )
         return image
     
-    # Check if gesture is still valid (closed hand)
-    if not is_closed_hand(hand_landmarks):
+    # Check if gesture is still valid (closed hand), unless the caller already checked it
+    if is_valid_gesture is None:
+        is_valid_gesture = is_closed_hand(hand_landmarks)
+    
+    if not is_valid_gesture:
         # Reset gesture state if hand is not closed
         if state.confirmed_gesture:
             state.confirmed_gesture = False
             state.gesture_confirmation_start_time = 0
             
-        cv2.putText(
+        draw_text(
             image, 
             "Voice trigger: Make closed fist gesture", 
             (10, 430), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (255, 255, 255), 
             2
@@ -61,16 +70,15 @@ def process_voice_command_gesture(image, hand_landmarks, fps, image_width, image
             state.start_gesture_confirmation()
         
         # Calculate confirmation progress
-        current_time = time.time()
+        current_time = state.now
         elapsed_time = current_time - state.gesture_confirmation_start_time
         progress = min(1.0, elapsed_time / state.gesture_confirmation_time)
         
         # Show confirmation progress
-        cv2.putText(
+        draw_glyph_text(
             image, 
             f"Voice trigger confirming... {progress:.1%}", 
             (10, 430), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (255, 255, 0),  # Yellow
             2
@@ -81,18 +89,18 @@ def process_voice_command_gesture(image, hand_landmarks, fps, image_width, image
             state.confirmed_gesture = True
             state.gesture_confirmation_start_time = 0
             
-            # Trigger voice recording ONLY ONCE
-            trigger_voice_recording()
+            # Trigger voice recording ONLY ONCE, on the background worker
+            if _voice_trigger is None or _voice_trigger.done():
+                _voice_trigger = _voice_executor.submit(trigger_voice_recording)
             
             # Set cooldown
             state.start_gesture_cooldown()
     else:
         # Gesture already confirmed, show processing state (NO RE-TRIGGERING)
-        cv2.putText(
+        draw_text(
             image, 
             "Voice command triggered! Processing...", 
             (10, 430), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
             0.7, 
             (0, 255, 0),  # Green
             2
@@ -131,3 +139,18 @@ def trigger_voice_recording():
         
     except Exception as e:
         print(f"Error triggering voice recording: {e}")
+
+def _preload_voice_modules():
+    """Import the voice modules (loading the Whisper model) and warm the model up"""
+    try:
+        from voice import transcriber
+        transcriber.warm_up()
+    except Exception as e:
+        print(f"Error loading voice modules: {e}")
+
+def start_voice_preload():
+    """
+    Load the voice modules ahead of the first trigger on a daemon thread,
+    so quitting the app never waits for the model to finish loading
+    """
+    threading.Thread(target=_preload_voice_modules, name="voice-preload", daemon=True).start()
@@ -11,13 +11,18 @@ Uses webcam to detect hand gestures for computer control:
 Supports both left and right hands and simultaneous dual-hand gestures
 """
 
+import os
 import cv2
 import numpy as np
-from camera import select_camera, initialize_camera
+from time import perf_counter
+from pynput.keyboard import Key
+from camera import select_camera, initialize_camera, LatestFrameReader
+from overlay import FONT, draw_text, draw_glyph_text, draw_sprite, make_sprite
 
 # Import from config
 from config import (
-    mp_hands, mp_drawing, mp_drawing_styles
+    keyboard, mp_hands, mp_drawing, mp_drawing_styles, DRAW_LANDMARKS, SHOW_PREVIEW, PRELOAD_VOICE,
+    MOTION_GATE_SIZE, MOTION_PIXEL_THRESHOLD, MOTION_MIN_PIXELS, DETECTION_MAX_WIDTH
 )
 
 # Import from gesture package
@@ -25,10 +30,41 @@ from gestures import (
     is_navigation_gesture, is_index_finger_only, is_ok_gesture, is_alt_tab_ok_gesture,
     is_scroll_gesture, is_open_hand, is_closed_hand, process_navigation_gesture, 
     process_mouse_control_gesture, process_mouse_click_gesture, process_scroll_gesture,
-    process_alt_tab_gesture, process_voice_command_gesture, gesture_states, 
-    update_all_cooldowns, reset_all_gesture_states
+    process_alt_tab_gesture, process_voice_command_gesture, gesture_states, mouse_click_state,
+    alt_tab_state, start_voice_preload,
+    landmarks_to_array, finger_extension_mask, wrist_distances_sq, update_frame_time, reset_all_gesture_states,
+    INDEX_EXTENDED, MIDDLE_EXTENDED, ALL_FINGERS_EXTENDED, OTHER_FINGERS_EXTENDED
 )
 
+# Gesture instructions at the bottom of the preview: text and height of its baseline above the bottom edge
+INSTRUCTIONS = (
+    ("Navigation: 2 fingers extended → LEFT/RIGHT", 180),
+    ("Alt+Tab: 5 fingers open hand → hold ALT ", 150),
+    ("End Alt+Tab: OK gesture while holding ALT → release ALT + click", 120),
+    ("Mouse control: Index finger only extended", 90),
+    ("Mouse click (with 2nd hand): OK gesture while controlling mouse", 60),
+    ("Scroll: Thumb + Index in L/V shape → VERTICAL scroll from reference point", 60),
+    ("Voice Command: Closed fist → Record 3s voice command (Japanese)", 30),
+)
+
+def draw_instructions(canvas, anchor):
+    """Draw the instruction lines above anchor, the bottom-left corner of the preview"""
+    for text, height in INSTRUCTIONS:
+        cv2.putText(
+            canvas, 
+            text, 
+            (anchor[0] + 10, anchor[1] - height), 
+            FONT, 
+            0.5, 
+            (255, 255, 255), 
+            1
+        )
+
+# Make sure OpenCV's optimized code paths are on, and keep its worker threads
+# to about one per physical core so they don't compete with MediaPipe's
+cv2.setUseOptimized(True)
+cv2.setNumThreads(max(1, (os.cpu_count() or 2) // 2))
+
 def main():
     # Replace the camera initialization logic
     selected_camera = select_camera()
@@ -43,12 +79,17 @@ def main():
         return
     
     print(f"Actual camera parameters: {actual_width}x{actual_height} @ {actual_fps} FPS")
-    print("Gesture Control Started. Press 'q' to quit.")
+    
+    # Load the voice command model in the background if asked to
+    if PRELOAD_VOICE:
+        start_voice_preload()
+    print("Gesture Control Started. " + ("Press 'q' to quit." if SHOW_PREVIEW else "Press Ctrl+C to quit."))
     
     # Configure hand detection parameters
     hands = mp_hands.Hands(
         static_image_mode=False,
         max_num_hands=2,  # Detect up to 2 hands
+        model_complexity=0,  # Lite landmark model, much faster and accurate enough for these gestures
         min_detection_confidence=0.6,
         min_tracking_confidence=0.5
     )
@@ -56,251 +97,299 @@ def main():
     # Calculate time to measure FPS
     prev_frame_time = 0
     new_frame_time = 0
+    fps = 0  # Smoothed over recent frames so the readout doesn't flicker
+    
+    # FPS value shown on screen, refreshed a few times per second
+    displayed_fps = 0
+    fps_display_time = 0
+    
+    # Instruction text sprite, built on the first frame once its width is known
+    instructions_sprite = None
     
-    while cap.isOpened():
-        success, image = cap.read()
-        if not success:
-            print("Could not read image from camera.")
-            break
+    # Last hand detection results and the thumbnail of the frame they came from
+    results = None
+    detected_gray = None
+    
+    # RGB copy of the frame for MediaPipe, allocated on the first detection
+    rgb_image = None
+    
+    # Landmark drawing styles, built once instead of for every hand on every frame
+    if DRAW_LANDMARKS:
+        landmark_style = mp_drawing_styles.get_default_hand_landmarks_style()
+        connection_style = mp_drawing_styles.get_default_hand_connections_style()
+    
+    # Preview window, drawn by the GPU when OpenCV was built with OpenGL support
+    window_name = 'Gesture PC Controller'
+    if SHOW_PREVIEW:
+        try:
+            cv2.namedWindow(window_name, cv2.WINDOW_OPENGL | cv2.WINDOW_AUTOSIZE)
+        except cv2.error:
+            cv2.namedWindow(window_name, cv2.WINDOW_AUTOSIZE)
+    
+    # Capture on a background thread so the loop always gets the newest frame
+    frame_reader = LatestFrameReader(cap).start()
+    
+    try:
+        while cap.isOpened():
+            success, image = frame_reader.read()
+            if not success:
+                print("Could not read image from camera.")
+                break
         
-        # Calculate and display FPS
-        new_frame_time = cv2.getTickCount() / cv2.getTickFrequency()
-        fps = 1 / (new_frame_time - prev_frame_time) if prev_frame_time > 0 else 0
-        prev_frame_time = new_frame_time
+            # Timestamp this frame once for all gesture timers
+            update_frame_time()
         
-        # Flip the image horizontally for a more intuitive mirror view
-        image = cv2.flip(image, 1)
-        image_height, image_width, _ = image.shape
+            # Calculate and display FPS
+            new_frame_time = perf_counter()
+            if prev_frame_time > 0:
+                frame_fps = 1 / (new_frame_time - prev_frame_time)
+                fps = frame_fps if fps == 0 else 0.9 * fps + 0.1 * frame_fps
+            prev_frame_time = new_frame_time
+            if new_frame_time - fps_display_time >= 0.2:
+                displayed_fps = fps
+                fps_display_time = new_frame_time
         
-        # Convert BGR image to RGB
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            # Flip the image horizontally for a more intuitive mirror view
+            image = cv2.flip(image, 1)
+            image_height, image_width, _ = image.shape
         
-        # Process the image and detect hands
-        results = hands.process(rgb_image)
+            # Small grayscale thumbnail used to tell whether anything moved
+            motion_gray = cv2.cvtColor(
+                cv2.resize(image, MOTION_GATE_SIZE, interpolation=cv2.INTER_AREA),
+                cv2.COLOR_BGR2GRAY
+            )
         
-        # Display FPS and instructions
-        cv2.putText(
-            image,
-            f"FPS: {fps:.1f}",
-            (image_width - 120, 30),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.7,
-            (0, 255, 0),
-            2
-        )
+            # While the scene is still and no gesture is confirming or active, the last
+            # results still describe this frame, so hand detection can be skipped
+            gesture_in_progress = any(
+                state.confirmed_gesture or state.gesture_confirmation_start_time or state.is_alt_pressed
+                for state in gesture_states.values()
+            )
+            if results is None or gesture_in_progress:
+                scene_changed = True
+            else:
+                _, moved_pixels = cv2.threshold(
+                    cv2.absdiff(motion_gray, detected_gray),
+                    MOTION_PIXEL_THRESHOLD,
+                    255,
+                    cv2.THRESH_BINARY
+                )
+                scene_changed = cv2.countNonZero(moved_pixels) >= MOTION_MIN_PIXELS
         
-        cv2.putText(
-            image, 
-            "Gesture Controls:", 
-            (10, 30), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            0.7, 
-            (255, 255, 255), 
-            2
-        )
+            if scene_changed:
+                # Detect on a smaller copy of large frames, landmarks are normalized
+                # to the image size so they still map onto the full-size image
+                if image_width > DETECTION_MAX_WIDTH:
+                    detection_image = cv2.resize(
+                        image,
+                        (DETECTION_MAX_WIDTH, round(image_height * DETECTION_MAX_WIDTH / image_width)),
+                        interpolation=cv2.INTER_AREA
+                    )
+                else:
+                    detection_image = image
+            
+                # Convert BGR image to RGB, into a buffer reused across frames
+                if rgb_image is None or rgb_image.shape != detection_image.shape:
+                    rgb_image = np.empty_like(detection_image)
+                cv2.cvtColor(detection_image, cv2.COLOR_BGR2RGB, dst=rgb_image)
+            
+                # Process the image and detect hands
+                results = hands.process(rgb_image)
+                detected_gray = motion_gray
+        
+            # Display FPS and instructions
+            draw_glyph_text(
+                image,
+                f"FPS: {displayed_fps:.1f}",
+                (image_width - 120, 30),
+                0.7,
+                (0, 255, 0),
+                2
+            )
+        
+            draw_text(
+                image, 
+                "Gesture Controls:", 
+                (10, 30), 
+                0.7, 
+                (255, 255, 255), 
+                2
+            )
         
-        # Update cooldowns regardless of whether a hand is detected
-        update_all_cooldowns(gesture_states, actual_fps)
-          # Process hand landmarks if detected
-        if results.multi_hand_landmarks:            # Keep track of whether specific gestures have been recognized
-            mouse_control_active = False
-            mouse_click_active = False
-            navigation_active = False
-            scroll_active = False
-            alt_tab_active = False  # New flag for Alt+Tab gesture
-            voice_command_active = False  # New flag for voice command gesture
+            # Cooldowns are timestamps checked on demand, so there is nothing to update per frame
+            # Process hand landmarks if detected
+            if results.multi_hand_landmarks:            # Keep track of whether specific gestures have been recognized
+                mouse_control_active = False
+                mouse_click_active = False
+                navigation_active = False
+                scroll_active = False
+                alt_tab_active = False  # New flag for Alt+Tab gesture
+                voice_command_active = False  # New flag for voice command gesture
             
-            # First loop: Process mouse control gesture only (primary hand)
-            for hand_landmarks in results.multi_hand_landmarks:
-                # Check for mouse control gesture (index finger only)
-                if is_index_finger_only(hand_landmarks):
-                    process_mouse_control_gesture(image, hand_landmarks, actual_fps, image_width, image_height)
-                    mouse_control_active = True
-                    break  # Once mouse control is found, exit this loop
+                # Convert each hand's landmarks to a NumPy array once per frame,
+                # all gesture checks and handlers below work on these arrays
+                hands_points = [
+                    landmarks_to_array(hand_landmarks)
+                    for hand_landmarks in results.multi_hand_landmarks
+                ]
             
-            # Second loop: Only process click gesture if mouse control is active
-            if mouse_control_active and len(results.multi_hand_landmarks) > 1:
-                # Process the other hands for potential click gesture
-                for hand_landmarks in results.multi_hand_landmarks:
-                    # Skip if this is the hand already being used for mouse control
-                    if is_index_finger_only(hand_landmarks):
-                        continue
+                # Which fingers are extended on each hand, gestures whose finger
+                # pattern doesn't match are skipped without running their full check
+                hand_masks = [finger_extension_mask(points) for points in hands_points]
+            
+                # Squared wrist-to-landmark distances of each hand, shared by all of its gesture checks
+                hands_distances = [wrist_distances_sq(points) for points in hands_points]
+            
+                # First loop: Process mouse control gesture only (primary hand)
+                for mouse_hand_index, (points, distances) in enumerate(zip(hands_points, hands_distances)):
+                    # Check for mouse control gesture (index finger only)
+                    if is_index_finger_only(points, distances):
+                        process_mouse_control_gesture(image, points, actual_fps, image_width, image_height, True)
+                        mouse_control_active = True
+                        break  # Once mouse control is found, exit this loop
+            
+                # Second loop: Only process click gesture if mouse control is active
+                if mouse_control_active and len(results.multi_hand_landmarks) > 1:
+                    # No click can fire while the last one is cooling down
+                    click_cooling_down = (
+                        mouse_click_state.now - mouse_click_state.cooldown_start_time
+                        < mouse_click_state.cooldown_duration
+                    )
+                
+                    # Process the other hands for potential click gesture
+                    for hand_index, (points, mask, distances) in enumerate(zip(hands_points, hand_masks, hands_distances)):
+                        # Skip the hand already being used for mouse control
+                        if hand_index == mouse_hand_index:
+                            continue
                     
-                    # Check for OK gesture for mouse click
-                    if is_ok_gesture(hand_landmarks):
-                        process_mouse_click_gesture(image, hand_landmarks, actual_fps, image_width, image_height)
-                        mouse_click_active = True
-                        break              # Third loop: Process other gestures if mouse control is not active
-            if not mouse_control_active:
-                # Special handling: If Alt+Tab is active, only allow Alt+Tab related gestures
-                from gestures import alt_tab_state
-                if alt_tab_state.is_alt_pressed:
-                    # Only process Alt+Tab gestures when Alt is being held
-                    for hand_landmarks in results.multi_hand_landmarks:
-                        if is_open_hand(hand_landmarks) or is_alt_tab_ok_gesture(hand_landmarks):
-                            process_alt_tab_gesture(image, hand_landmarks, actual_fps, image_width, image_height)
-                            alt_tab_active = True
-                            break
-                else:                    # Normal gesture processing when Alt+Tab is not active
-                    for hand_landmarks in results.multi_hand_landmarks:
-                        # Check for Alt+Tab gesture (open hand)
-                        if is_open_hand(hand_landmarks):
-                            process_alt_tab_gesture(image, hand_landmarks, actual_fps, image_width, image_height)
-                            alt_tab_active = True
+                        # Check for OK gesture for mouse click (middle, ring and pinky extended)
+                        if mask & OTHER_FINGERS_EXTENDED != OTHER_FINGERS_EXTENDED:
+                            continue
+                    
+                        # During the cooldown the handler only keeps confirming,
+                        # so leave the full OK check to it (it skips it there)
+                        if click_cooling_down:
+                            process_mouse_click_gesture(image, points, actual_fps, image_width, image_height)
+                            mouse_click_active = True
                             break
+                    
+                        if is_ok_gesture(points, distances):
+                            process_mouse_click_gesture(image, points, actual_fps, image_width, image_height, True)
+                            mouse_click_active = True
+                            break              # Third loop: Process other gestures if mouse control is not active
+                if not mouse_control_active:
+                    # Special handling: If Alt+Tab is active, only allow Alt+Tab related gestures
+                    if alt_tab_state.is_alt_pressed:
+                        # Only process Alt+Tab gestures when Alt is being held
+                        for points, mask, distances in zip(hands_points, hand_masks, hands_distances):
+                            if ((mask == ALL_FINGERS_EXTENDED and is_open_hand(points, distances)) or 
+                                    is_alt_tab_ok_gesture(points, distances)):
+                                process_alt_tab_gesture(image, points, actual_fps, image_width, image_height)
+                                alt_tab_active = True
+                                break
+                    else:                    # Normal gesture processing when Alt+Tab is not active
+                        for points, mask, distances in zip(hands_points, hand_masks, hands_distances):
+                            # Check for Alt+Tab gesture (open hand)
+                            if mask == ALL_FINGERS_EXTENDED and is_open_hand(points, distances):
+                                process_alt_tab_gesture(image, points, actual_fps, image_width, image_height)
+                                alt_tab_active = True
+                                break
                         
-                        # Check for scroll gesture (L/V shape with thumb and index)
-                        if is_scroll_gesture(hand_landmarks):
-                            process_scroll_gesture(image, hand_landmarks, actual_fps, image_width, image_height)
-                            scroll_active = True
-                            break
+                            # Check for scroll gesture (L/V shape with thumb and index)
+                            if mask & OTHER_FINGERS_EXTENDED == 0 and is_scroll_gesture(points, distances):
+                                process_scroll_gesture(image, points, actual_fps, image_width, image_height, True)
+                                scroll_active = True
+                                break
                         
-                        # Check for navigation gesture (index and middle fingers extended)
-                        if not scroll_active and is_navigation_gesture(hand_landmarks):
-                            process_navigation_gesture(image, hand_landmarks, actual_fps, image_width, image_height)
-                            navigation_active = True
-                            break
-                          # Check for voice command gesture (closed hand)
-                        if is_closed_hand(hand_landmarks):
-                            process_voice_command_gesture(image, hand_landmarks, actual_fps, image_width, image_height)
-                            voice_command_active = True
-                            break
+                            # Check for navigation gesture (index and middle fingers extended)
+                            if (not scroll_active and mask == INDEX_EXTENDED | MIDDLE_EXTENDED and 
+                                    is_navigation_gesture(points)):
+                                process_navigation_gesture(image, points, actual_fps, image_width, image_height, True)
+                                navigation_active = True
+                                break
+                              # Check for voice command gesture (closed hand)
+                            if mask == 0 and is_closed_hand(points, distances):
+                                process_voice_command_gesture(image, points, actual_fps, image_width, image_height, True)
+                                voice_command_active = True
+                                break
             
-            # Process each hand separately to add labels
-            for i, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                # Draw hand landmarks on the image
-                mp_drawing.draw_landmarks(
-                    image,
-                    hand_landmarks,
-                    mp_hands.HAND_CONNECTIONS,
-                    mp_drawing_styles.get_default_hand_landmarks_style(),
-                    mp_drawing_styles.get_default_hand_connections_style()
-                )
+                # Process each hand separately to add labels
+                for i, (hand_landmarks, points) in enumerate(zip(results.multi_hand_landmarks, hands_points)):
+                    # Draw hand landmarks on the image
+                    if DRAW_LANDMARKS:
+                        mp_drawing.draw_landmarks(
+                            image,
+                            hand_landmarks,
+                            mp_hands.HAND_CONNECTIONS,
+                            landmark_style,
+                            connection_style
+                        )
                 
-                # Add hand number to display
-                hand_text = f"Hand {i+1}"
-                wrist = hand_landmarks.landmark[mp_hands.HandLandmark.WRIST]
-                wrist_x = int(wrist.x * image_width)
-                wrist_y = int(wrist.y * image_height)
-                cv2.putText(
-                    image,
-                    hand_text,
-                    (wrist_x, wrist_y - 10),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (255, 255, 0),
-                    1
-                )            # If no recognizable gesture was found - special handling when Alt is being held
-            from gestures import alt_tab_state
-            if not (mouse_control_active or navigation_active or mouse_click_active or scroll_active or alt_tab_active or voice_command_active):
-                # Only reset gesture states if Alt is not being held
-                if not alt_tab_state.is_alt_pressed:
-                    reset_all_gesture_states(gesture_states)
+                    # Add hand number to display
+                    hand_text = f"Hand {i+1}"
+                    wrist_x, wrist_y = points[0, :2].tolist()  # WRIST
+                    wrist_x = int(wrist_x * image_width)
+                    wrist_y = int(wrist_y * image_height)
+                    draw_text(
+                        image,
+                        hand_text,
+                        (wrist_x, wrist_y - 10),
+                        0.5,
+                        (255, 255, 0),
+                        1
+                    )            # If no recognizable gesture was found - special handling when Alt is being held
+                if not (mouse_control_active or navigation_active or mouse_click_active or scroll_active or alt_tab_active or voice_command_active):
+                    # Only reset gesture states if Alt is not being held
+                    if not alt_tab_state.is_alt_pressed:
+                        reset_all_gesture_states(gesture_states)
                 
-                cv2.putText(
+                    draw_text(
+                        image, 
+                        "No valid gesture detected" + (" (ALT still held)" if alt_tab_state.is_alt_pressed else ""), 
+                        (10, 70), 
+                        0.7, 
+                        (0, 0, 255), 
+                        2
+                    )
+            else:
+                # No hands detected, reset all gesture states
+                reset_all_gesture_states(gesture_states)
+            
+                draw_text(
                     image, 
-                    "No valid gesture detected" + (" (ALT still held)" if alt_tab_state.is_alt_pressed else ""), 
+                    "No hand detected", 
                     (10, 70), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 
                     0.7, 
                     (0, 0, 255), 
                     2
                 )
-        else:
-            # No hands detected, reset all gesture states
-            reset_all_gesture_states(gesture_states)
-            
-            cv2.putText(
-                image, 
-                "No hand detected", 
-                (10, 70), 
-                cv2.FONT_HERSHEY_SIMPLEX, 
-                0.7, 
-                (0, 0, 255), 
-                2
-            )
-          # Add gesture instruction text
-        cv2.putText(
-            image, 
-            "Navigation: 2 fingers extended → LEFT/RIGHT", 
-            (10, image_height - 180), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            0.5, 
-            (255, 255, 255), 
-            1
-        )
-        
-        cv2.putText(
-            image, 
-            "Alt+Tab: 5 fingers open hand → hold ALT ", 
-            (10, image_height - 150), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            0.5, 
-            (255, 255, 255), 
-            1
-        )
-        
-        cv2.putText(
-            image, 
-            "End Alt+Tab: OK gesture while holding ALT → release ALT + click", 
-            (10, image_height - 120), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            0.5, 
-            (255, 255, 255), 
-            1
-        )
-        
-        cv2.putText(
-            image, 
-            "Mouse control: Index finger only extended", 
-            (10, image_height - 90), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            0.5, 
-            (255, 255, 255), 
-            1
-        )
-        
-        cv2.putText(
-            image, 
-            "Mouse click (with 2nd hand): OK gesture while controlling mouse", 
-            (10, image_height - 60), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            0.5, 
-            (255, 255, 255), 
-            1
-        )
-          # New instruction for scroll gesture
-        cv2.putText(
-            image, 
-            "Scroll: Thumb + Index in L/V shape → VERTICAL scroll from reference point", 
-            (10, image_height - 60), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            0.5, 
-            (255, 255, 255), 
-            1
-        )
-        
-        # New instruction for voice command gesture
-        cv2.putText(
-            image, 
-            "Voice Command: Closed fist → Record 3s voice command (Japanese)", 
-            (10, image_height - 30), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            0.5, 
-            (255, 255, 255), 
-            1
-        )
+            # Gesture instructions, rendered once for the frame width and then copied each frame
+            if instructions_sprite is None:
+                instructions_sprite = make_sprite(image_width, 200, (0, 200), draw_instructions)
+            draw_sprite(image, instructions_sprite, (0, image_height))
         
-        # Show the image with annotations
-        cv2.imshow('Gesture PC Controller', image)
-        
-        # Exit on 'q' key press
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
+            # Show the image with annotations
+            if SHOW_PREVIEW:
+                cv2.imshow(window_name, image)
+            
+                # Exit on 'q' key press, pollKey pumps the window events without waitKey's 1 ms sleep
+                if cv2.pollKey() & 0xFF == ord('q'):
+                    break
     
-    # Release resources
-    cap.release()
-    cv2.destroyAllWindows()
+    except KeyboardInterrupt:
+        # Ctrl+C is the way to quit without a preview window
+        print("Stopping gesture control...")
+    finally:
+        # Don't leave Alt held down if Alt+Tab was active
+        if alt_tab_state.is_alt_pressed:
+            keyboard.release(Key.alt)
+            alt_tab_state.is_alt_pressed = False
+        
+        # Release resources
+        frame_reader.stop()
+        cap.release()
+        if SHOW_PREVIEW:
+            cv2.destroyAllWindows()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
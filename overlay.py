@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cached text overlays for the camera preview
+Each distinct text is rasterized once with cv2.putText into a small tile,
+later frames only copy the tile's text pixels onto the image
+"""
+
+import cv2
+import numpy as np
+from collections import OrderedDict
+from config import DRAW_OVERLAY
+
+# Font used for all overlay text
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# Rendered text tiles keyed by (text, font_scale, color, thickness), in least
+# recently used order, the oldest is dropped once there are more than _TEXT_CACHE_SIZE
+_text_cache = OrderedDict()
+_TEXT_CACHE_SIZE = 512
+
+# Horizontal advance of single characters keyed by (char, font_scale, thickness)
+_glyph_advances = {}
+
+def _crop_tile(mask, offset_x, offset_y, color):
+    """
+    Crop a mask to the pixels it actually covers, so each blit only touches
+    that rectangle of the frame, and build the matching color tile
+    color is either a BGR tuple or an image of the same size as the mask
+    Returns (tile, mask, offset_x, offset_y) with the offsets adjusted to the crop
+    """
+    top, left = 0, 0
+    bottom, right = mask.shape[:2]
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    if rows.size:
+        top, bottom = rows[0], rows[-1] + 1
+        left, right = cols[0], cols[-1] + 1
+        mask = mask[top:bottom, left:right]
+        offset_x -= left
+        offset_y -= top
+
+    if isinstance(color, np.ndarray):
+        tile = color[top:bottom, left:right].copy()
+    else:
+        tile = np.empty(mask.shape + (3,), dtype=np.uint8)
+        tile[:] = color
+
+    return tile, mask[:, :, None] > 0, offset_x, offset_y
+
+def _render_text_tile(text, font_scale, color, thickness):
+    """
+    Render text into a color tile and a mask of the text pixels
+    Returns (tile, mask, offset_x, offset_y) where the offsets locate the
+    text origin (bottom-left of the baseline) inside the tile
+    """
+    (text_width, text_height), baseline = cv2.getTextSize(text, FONT, font_scale, thickness)
+
+    # Thick strokes and tall glyphs like brackets can extend past the
+    # measured box, so pad every side
+    pad = int(10 * font_scale) + thickness
+    tile_width = text_width + 2 * pad
+    tile_height = text_height + baseline + 2 * pad
+    offset_x = pad
+    offset_y = pad + text_height
+
+    mask = np.zeros((tile_height, tile_width), dtype=np.uint8)
+    cv2.putText(mask, text, (offset_x, offset_y), FONT, font_scale, 255, thickness)
+
+    return _crop_tile(mask, offset_x, offset_y, color)
+
+def draw_text(image, text, org, font_scale, color, thickness=1):
+    """
+    Draw text the same way as cv2.putText with FONT_HERSHEY_SIMPLEX,
+    reusing a cached rendering of the text
+    Meant for texts with a limited set of values (status messages,
+    percentages), the cache only keeps the most recently used texts
+    """
+    if not DRAW_OVERLAY:
+        return image
+
+    key = (text, font_scale, color, thickness)
+    entry = _text_cache.get(key)
+    if entry is None:
+        entry = _render_text_tile(text, font_scale, color, thickness)
+        _text_cache[key] = entry
+        if len(_text_cache) > _TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return draw_sprite(image, entry, org)
+
+def _glyph_advance(char, font_scale, thickness):
+    """Horizontal distance cv2.putText moves the pen after drawing char"""
+    key = (char, font_scale, thickness)
+    advance = _glyph_advances.get(key)
+    if advance is None:
+        # getTextSize pads a single character for the stroke thickness,
+        # so measure the step from a long run of the character instead
+        single_width = cv2.getTextSize(char, FONT, font_scale, thickness)[0][0]
+        run_width = cv2.getTextSize(char * 101, FONT, font_scale, thickness)[0][0]
+        advance = (run_width - single_width) / 100
+        _glyph_advances[key] = advance
+    return advance
+
+def draw_glyph_text(image, text, org, font_scale, color, thickness=1):
+    """
+    Draw frequently changing text (coordinates, movement values) one character
+    at a time from cached glyph tiles, so the cache is bounded by the character
+    set instead of growing with every distinct string
+    Glyphs are snapped to whole pixels, so they can sit up to half a pixel
+    from where cv2.putText would draw them
+    """
+    if not DRAW_OVERLAY:
+        return image
+
+    pen_x, y = org
+    for char in text:
+        if char != ' ':
+            draw_text(image, char, (int(pen_x + 0.5), y), font_scale, color, thickness)
+        pen_x += _glyph_advance(char, font_scale, thickness)
+    return image
+
+def make_cursor_sprite(radius, label, label_offset, font_scale, color, thickness=1):
+    """
+    Pre-render a filled circle with a text label into a single sprite
+    The sprite's anchor is the circle center, label_offset is the text origin
+    relative to it (same as the offset passed to cv2.putText before)
+    """
+    label_x, label_y = label_offset
+    (text_width, text_height), baseline = cv2.getTextSize(label, FONT, font_scale, thickness)
+
+    # Make the canvas large enough for the circle and the label around the anchor
+    pad = int(10 * font_scale) + thickness
+    half_width = max(radius, abs(label_x) + text_width) + pad
+    half_height = max(radius, abs(label_y) + text_height + baseline) + pad
+    mask = np.zeros((2 * half_height + 1, 2 * half_width + 1), dtype=np.uint8)
+
+    cv2.circle(mask, (half_width, half_height), radius, 255, -1)
+    cv2.putText(
+        mask,
+        label,
+        (half_width + label_x, half_height + label_y),
+        FONT,
+        font_scale,
+        255,
+        thickness
+    )
+
+    return _crop_tile(mask, half_width, half_height, color)
+
+def make_sprite(width, height, anchor, draw):
+    """
+    Pre-render a fixed drawing made of several cv2 calls (in any colors)
+    into one sprite, so it can be placed with a single draw_sprite call
+    draw(canvas, anchor) must draw everything relative to anchor on a
+    canvas of the given size
+    """
+    # Draw on two different backgrounds, pixels that come out the same on
+    # both are the ones the drawing painted
+    first = np.full((height, width, 3), 1, dtype=np.uint8)
+    second = np.full((height, width, 3), 2, dtype=np.uint8)
+    draw(first, anchor)
+    draw(second, anchor)
+    mask = (first == second).all(axis=2)
+
+    return _crop_tile(mask, anchor[0], anchor[1], first)
+
+def draw_sprite(image, sprite, org):
+    """
+    Copy a pre-rendered sprite onto the image with its anchor at org,
+    clipped to the image bounds
+    """
+    if not DRAW_OVERLAY:
+        return image
+
+    tile, mask, offset_x, offset_y = sprite
+
+    # Top-left corner of the tile in the image
+    x = org[0] - offset_x
+    y = org[1] - offset_y
+    tile_height, tile_width = mask.shape[:2]
+    image_height, image_width = image.shape[:2]
+
+    # Clip the tile to the image bounds
+    x0 = max(x, 0)
+    y0 = max(y, 0)
+    x1 = min(x + tile_width, image_width)
+    y1 = min(y + tile_height, image_height)
+    if x0 >= x1 or y0 >= y1:
+        return image
+
+    np.copyto(
+        image[y0:y1, x0:x1],
+        tile[y0 - y:y1 - y, x0 - x:x1 - x],
+        where=mask[y0 - y:y1 - y, x0 - x:x1 - x]
+    )
+    return image
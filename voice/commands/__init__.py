@@ -6,13 +6,29 @@ Voice commands module
 Centralized import and management of all voice commands
 """
 
+import unicodedata
 from .youtube import YOUTUBE_COMMANDS, execute_open_youtube
 from .tab_control import TAB_COMMANDS, execute_close_tab
 
-# Combine all commands into one dictionary
+def normalize_text(text):
+    """
+    Fold full-width/half-width characters and case (NFKC + lower),
+    so spellings like "ＹｏｕＴｕｂｅ" and "youtube" compare equal
+    """
+    return unicodedata.normalize("NFKC", text).lower()
+
+# Combine all commands into one dictionary keyed by normalized text,
+# aliases that only differ in width or case collapse into one entry
 ALL_COMMANDS = {}
-ALL_COMMANDS.update(YOUTUBE_COMMANDS)
-ALL_COMMANDS.update(TAB_COMMANDS)
+for commands in (YOUTUBE_COMMANDS, TAB_COMMANDS):
+    for command_key, command in commands.items():
+        ALL_COMMANDS[normalize_text(command_key)] = command
+
+# Functions performing each command action, keyed by the command's "action"
+ACTION_HANDLERS = {
+    "open_youtube": execute_open_youtube,
+    "close_tab": execute_close_tab
+}
 
 def execute_command(command_key):
     """Execute the action for a given command key"""
@@ -27,10 +43,9 @@ def execute_command(command_key):
     
     try:
         # Handle complex actions
-        if action == "open_youtube":
-            return execute_open_youtube()
-        elif action == "close_tab":
-            return execute_close_tab()
+        handler = ACTION_HANDLERS.get(action)
+        if handler is not None:
+            return handler()
         
         print(f"Command executed successfully: {command['description']}")
         return True
@@ -10,44 +10,29 @@ from pynput.keyboard import Key, KeyCode
 from config import keyboard
 import time
 
-# Dictionary mapping Japanese voice commands to tab control actions
-TAB_COMMANDS = {
-    "タブを閉じて": {
-        "description": "Close current tab",
-        "action": "close_tab",
-        "keys": None,
-        "confidence_threshold": 0.6
-    },
-    "tabを閉じて": {
-        "description": "Close current tab",
-        "action": "close_tab",
-        "keys": None,
-        "confidence_threshold": 0.6
-    },
-    "タブ閉じて": {
-        "description": "Close current tab",
-        "action": "close_tab",
-        "keys": None,
-        "confidence_threshold": 0.6
-    },
-    "tab閉じて": {
-        "description": "Close current tab",
-        "action": "close_tab",
-        "keys": None,
-        "confidence_threshold": 0.6
-    }
+# Key for the Ctrl+W shortcut, built once
+_KEY_W = KeyCode.from_char('w')
+
+# Close tab action, shared by all of its spoken variants
+CLOSE_TAB_ACTION = {
+    "description": "Close current tab",
+    "action": "close_tab",
+    "keys": None,
+    "confidence_threshold": 0.6,
+    "aliases": ["タブを閉じて", "tabを閉じて", "タブ閉じて", "tab閉じて"]
 }
 
+# Dictionary mapping Japanese voice commands to tab control actions
+TAB_COMMANDS = {alias: CLOSE_TAB_ACTION for alias in CLOSE_TAB_ACTION["aliases"]}
+
 def execute_close_tab():
     """Execute close tab action using Ctrl+W"""
     try:
         print("Closing current tab...")
         
         # Press Ctrl+W to close current tab
-        keyboard.press(Key.ctrl)
-        keyboard.press(KeyCode.from_char('w'))
-        keyboard.release(KeyCode.from_char('w'))
-        keyboard.release(Key.ctrl)
+        with keyboard.pressed(Key.ctrl):
+            keyboard.tap(_KEY_W)
         
         print("Tab closed successfully!")
         return True
@@ -6,62 +6,30 @@ YouTube voice commands
 Japanese voice commands for YouTube operations
 """
 
-from pynput.keyboard import Key, KeyCode
-from config import keyboard
-import time
+import webbrowser
 
-# Dictionary mapping Japanese voice commands to YouTube actions
-YOUTUBE_COMMANDS = {
-    "ユチュブを開いて": {
-        "description": "Open YouTube",
-        "action": "open_youtube", 
-        "keys": None,  
-        "confidence_threshold": 0.6  
-    },
-    "YouTube開いて": {
-        "description": "Open YouTube",
-        "action": "open_youtube",
-        "keys": None,
-        "confidence_threshold": 0.6
-    },
-    "YouTubeを開いて": {
-        "description": "Open YouTube", 
-        "action": "open_youtube",
-        "keys": None,
-        "confidence_threshold": 0.6
-    },
-    "youtube開いて": {
-        "description": "Open YouTube",
-        "action": "open_youtube", 
-        "keys": None,
-        "confidence_threshold": 0.6
-    }
+# Page opened by the YouTube command
+YOUTUBE_URL = "https://www.youtube.com"
+
+# Open YouTube action, shared by all of its spoken variants
+OPEN_YOUTUBE_ACTION = {
+    "description": "Open YouTube",
+    "action": "open_youtube",
+    "keys": None,
+    "confidence_threshold": 0.6,
+    "aliases": ["ユチュブを開いて", "YouTube開いて", "YouTubeを開いて", "youtube開いて"]
 }
 
+# Dictionary mapping Japanese voice commands to YouTube actions
+YOUTUBE_COMMANDS = {alias: OPEN_YOUTUBE_ACTION for alias in OPEN_YOUTUBE_ACTION["aliases"]}
+
 def execute_open_youtube():
-    """Execute complex YouTube opening sequence"""
+    """Open YouTube in a new tab of the default browser"""
     try:
-        # Step 1: Ctrl+T (new tab)
-        print("Step 1: Opening new tab...")
-        keyboard.press(Key.ctrl)
-        keyboard.press(KeyCode.from_char('t'))
-        keyboard.release(KeyCode.from_char('t'))
-        keyboard.release(Key.ctrl)
-        
-        # Wait a moment for tab to open
-        time.sleep(0.5)
-        
-        # Step 2: Type youtube.com
-        print("Step 2: Typing youtube.com...")
-        keyboard.type("youtube.com")
-        
-        # Wait a moment before pressing Enter
-        time.sleep(0.3)
-        
-        # Step 3: Press Enter
-        print("Step 3: Pressing Enter...")
-        keyboard.press(Key.enter)
-        keyboard.release(Key.enter)
+        print("Opening YouTube in a new tab...")
+        if not webbrowser.open_new_tab(YOUTUBE_URL):
+            print("No browser available to open YouTube")
+            return False
         
         print("YouTube opened successfully!")
         return True
@@ -6,9 +6,29 @@ Text matching module using rapidfuzz
 Matches transcribed text with predefined voice commands
 """
 
+from functools import lru_cache
 from rapidfuzz import fuzz, process
 from typing import Optional, Tuple, List
-from voice.commands import get_all_commands, get_command_info
+from voice.commands import get_all_commands, get_command_info, normalize_text
+
+@lru_cache(maxsize=512)
+def _best_scored_command(text: str, commands: Tuple[str, ...]) -> Tuple[str, float]:
+    """
+    Score text against every command with several matching algorithms
+    Results are cached, since the same few phrases are spoken over and over
+    
+    Returns:
+        Tuple of (command_key, score) with the score in the 0-100 range
+    """
+    # extractOne scores every command in one C call and returns the
+    # first command with the highest score for each method
+    candidates = [
+        process.extractOne(text, commands, scorer=scorer)[:2]
+        for scorer in (fuzz.ratio, fuzz.partial_ratio, fuzz.token_ratio)
+    ]
+    
+    # Choose the best overall match
+    return max(candidates, key=lambda x: x[1])
 
 class CommandMatcher:
     def __init__(self, min_confidence: float = 0.6):
@@ -40,36 +60,19 @@ class CommandMatcher:
             print("No commands available for matching!")
             return None
         
-        # Clean the input text
-        cleaned_text = transcribed_text.strip()
+        # Clean the input text, normalized the same way as the command keys
+        cleaned_text = normalize_text(transcribed_text.strip())
         print(f"Matching text: '{cleaned_text}'")
         
+        # Exact command, no fuzzy scoring needed
+        if get_command_info(cleaned_text) is not None:
+            print(f"Exact match: '{cleaned_text}'")
+            return (cleaned_text, 1.0)
+        
         # Find best match using rapidfuzz
         try:
             # Use different matching algorithms and take the best score
-            ratio_scores = []
-            partial_scores = []
-            token_scores = []
-            
-            for command in available_commands:
-                ratio_score = fuzz.ratio(cleaned_text, command)
-                partial_score = fuzz.partial_ratio(cleaned_text, command)
-                token_score = fuzz.token_ratio(cleaned_text, command)
-                
-                ratio_scores.append((command, ratio_score))
-                partial_scores.append((command, partial_score))
-                token_scores.append((command, token_score))
-            
-            # Get best scores from each method
-            best_ratio = max(ratio_scores, key=lambda x: x[1])
-            best_partial = max(partial_scores, key=lambda x: x[1])
-            best_token = max(token_scores, key=lambda x: x[1])
-            
-            # Choose the best overall match
-            candidates = [best_ratio, best_partial, best_token]
-            best_match = max(candidates, key=lambda x: x[1])
-            
-            command_key, confidence = best_match
+            command_key, confidence = _best_scored_command(cleaned_text, tuple(available_commands))
             confidence_normalized = confidence / 100.0  # Convert to 0-1 range
             
             print(f"Best match: '{command_key}' with confidence: {confidence_normalized:.2f}")
@@ -106,25 +109,21 @@ class CommandMatcher:
             return []
             
         available_commands = get_all_commands()
-        cleaned_text = transcribed_text.strip()
+        cleaned_text = normalize_text(transcribed_text.strip())
         
         try:
-            # Get matches using process.extract
+            # Get matches using process.extract, commands scoring below
+            # min_confidence are cut off inside rapidfuzz
             matches = process.extract(
                 cleaned_text, 
                 available_commands, 
                 scorer=fuzz.ratio,
-                limit=limit
+                limit=limit,
+                score_cutoff=self.min_confidence * 100
             )
             
             # Convert to our format and normalize scores
-            result = []
-            for command, score, _ in matches:
-                confidence = score / 100.0
-                if confidence >= self.min_confidence:
-                    result.append((command, confidence))
-            
-            return result
+            return [(command, score / 100.0) for command, score, _ in matches]
             
         except Exception as e:
             print(f"Error getting all matches: {e}")
@@ -12,6 +12,16 @@ import time
 import threading
 from typing import Optional, Callable
 
+# Mean absolute level below which an audio block counts as silence
+# (in 16-bit sample units, about 1% of full scale)
+SILENCE_LEVEL = 328
+
+# Stop recording once the speaker has been silent for this long (seconds)
+SILENCE_STOP_TIME = 0.6
+
+# Frames delivered per audio callback
+BLOCK_SIZE = 1024
+
 class VoiceRecorder:
     def __init__(self, sample_rate: int = 16000, duration: float = 3.0):
         """
@@ -27,6 +37,12 @@ class VoiceRecorder:
         self.audio_data = None
         self.recording_thread = None
         
+        # Recording buffer for the maximum duration, reused by every recording
+        # Samples stay 16-bit PCM as the sound card delivers them, the
+        # transcriber converts them to float once
+        self._buffer = np.zeros((int(duration * sample_rate), 1), dtype=np.int16)
+        self._position = 0
+        
     def start_recording(self, callback: Optional[Callable] = None):
         """
         Start recording audio
@@ -61,20 +77,53 @@ class VoiceRecorder:
         return self.audio_data
     
     def _record_audio(self, callback: Optional[Callable] = None):
-        """Internal method to record audio"""
+        """
+        Internal method to record audio
+        Stops at the maximum duration, when stop_recording is called, or once
+        the speaker goes quiet after having said something
+        """
         try:
-            # Record audio
-            self.audio_data = sd.rec(
-                int(self.duration * self.sample_rate),
+            self._position = 0
+            speech_heard = False
+            silent_blocks = 0
+            max_silent_blocks = max(1, int(SILENCE_STOP_TIME * self.sample_rate / BLOCK_SIZE))
+            finished = threading.Event()
+            
+            def on_audio_block(indata, frames, time_info, status):
+                nonlocal speech_heard, silent_blocks
+                
+                # Copy the block into the recording buffer
+                start = self._position
+                end = min(start + frames, len(self._buffer))
+                self._buffer[start:end] = indata[:end - start]
+                self._position = end
+                
+                # Track silence after the first spoken block
+                if np.abs(indata, dtype=np.int32).mean() < SILENCE_LEVEL:
+                    silent_blocks += 1
+                else:
+                    speech_heard = True
+                    silent_blocks = 0
+                
+                if (end == len(self._buffer) or not self.is_recording
+                        or (speech_heard and silent_blocks >= max_silent_blocks)):
+                    raise sd.CallbackStop
+            
+            # Record audio until the callback stops the stream
+            with sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=1,
-                dtype=np.float32
-            )
+                dtype=np.int16,
+                blocksize=BLOCK_SIZE,
+                callback=on_audio_block,
+                finished_callback=finished.set
+            ):
+                finished.wait()
             
-            # Wait for recording to complete
-            sd.wait()
+            # Copy out only the recorded part, the buffer is reused by the next recording
+            self.audio_data = self._buffer[:self._position].copy()
             
-            print("Recording completed!")
+            print(f"Recording completed! ({self._position / self.sample_rate:.1f}s)")
             self.is_recording = False
             
             # Call callback if provided
@@ -8,12 +8,26 @@ Converts audio to Japanese text for command recognition
 
 import whisper
 import numpy as np
-import tempfile
-import os
 from typing import Optional
-import soundfile as sf
+from scipy.signal import resample_poly
 import torch
 
+# Every decode runs the encoder convolutions on the same (n_mels, 3000) mel,
+# so let cuDNN benchmark once and keep the fastest algorithm
+torch.backends.cudnn.benchmark = True
+
+# Same limits whisper's transcribe() uses to drop a window as silence
+NO_SPEECH_THRESHOLD = 0.6
+LOGPROB_THRESHOLD = -1.0
+
+def _cpu_supports_bf16() -> bool:
+    """Check if the CPU has native bfloat16 instructions (AVX512-BF16)"""
+    check = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+    try:
+        return bool(check is not None and check())
+    except Exception:
+        return False
+
 class WhisperTranscriber:
     def __init__(self, model_name: str = "small"):
         """
@@ -25,6 +39,14 @@ class WhisperTranscriber:
         self.model_name = model_name
         self.model = None
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.decode_options = whisper.DecodingOptions(
+            language="ja",  # Japanese
+            fp16=(self.device == "cuda"),  # Only use fp16 on GPU
+            without_timestamps=True
+        )
+        # fp16 is emulated on CPUs and slower than fp32, but bfloat16 has
+        # hardware support on recent ones, so run the matmuls in it there
+        self.cpu_bf16 = self.device == "cpu" and _cpu_supports_bf16()
         self._load_model()
     
     def _load_model(self):
@@ -34,12 +56,57 @@ class WhisperTranscriber:
                 print(f"🚀 Loading Whisper model '{self.model_name}' on **GPU (cuda)** ...")
             else:
                 print(f"🐢 Loading Whisper model '{self.model_name}' on **CPU** (no GPU available) ...")
+                if self.cpu_bf16:
+                    print("Using bfloat16 on CPU")
             self.model = whisper.load_model(self.model_name).to(self.device)
+            if self.device == "cuda":
+                # Store the weights in fp16 once, instead of having every layer
+                # cast its fp32 weights for each fp16 call
+                # Whisper runs its LayerNorms in fp32, so their weights stay fp32
+                self.model.half()
+                for module in self.model.modules():
+                    if isinstance(module, torch.nn.LayerNorm):
+                        module.float()
             print("✅ Whisper model loaded successfully!")
         except Exception as e:
             print(f"❌ Error loading Whisper model: {e}")
             self.model = None
     
+    def warm_up(self):
+        """
+        Decode one second of silence, so kernel loading and memory allocation
+        happen ahead of time instead of delaying the first voice command
+        """
+        if self.model is None:
+            return
+        
+        try:
+            self._decode(np.zeros(whisper.audio.SAMPLE_RATE, dtype=np.float32))
+            print("✅ Whisper model warmed up!")
+        except Exception as e:
+            print(f"⚠️ Whisper warm-up failed: {e}")
+    
+    def _decode(self, audio: np.ndarray) -> str:
+        """
+        Decode 16kHz mono audio shorter than Whisper's 30 second window
+        Voice commands fit in a single window, so this skips transcribe()'s
+        sliding window and builds the mel spectrogram directly on the model's device
+        """
+        # inference_mode also skips the autograd version tracking no_grad keeps
+        with torch.inference_mode():
+            mel = whisper.log_mel_spectrogram(
+                whisper.pad_or_trim(audio),
+                self.model.dims.n_mels,
+                device=self.device
+            )
+            with torch.autocast("cpu", dtype=torch.bfloat16, enabled=self.cpu_bf16):
+                result = whisper.decode(self.model, mel, self.decode_options)
+        
+        # Silence makes Whisper invent text, drop it the way transcribe() does
+        if result.no_speech_prob > NO_SPEECH_THRESHOLD and result.avg_logprob < LOGPROB_THRESHOLD:
+            return ""
+        return result.text
+    
     def transcribe_audio(self, audio_data: np.ndarray, sample_rate: int = 16000) -> Optional[str]:
         """
         Transcribe audio data to text
@@ -60,41 +127,27 @@ class WhisperTranscriber:
             return None
         
         try:
-            # Create temporary audio file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_filename = temp_file.name
-                
-            # Flatten audio data if it's 2D
-            if len(audio_data.shape) > 1:
-                audio_data = audio_data.flatten()
-                
-            # Save audio to .wav
-            sf.write(temp_filename, audio_data, sample_rate)
+            # Whisper takes the samples directly as a mono float32 array,
+            # so flatten 2D recordings instead of going through a .wav file
+            audio = np.ascontiguousarray(audio_data.reshape(-1), dtype=np.float32)
             
-            # Transcribe using Whisper
-            print("📝 Transcribing audio...")
-            result = self.model.transcribe(
-                temp_filename,
-                language="ja",  # Japanese
-                fp16=(self.device == "cuda"),  # Only use fp16 on GPU
-                verbose=False
-            )
+            # Scale integer PCM (16-bit from the recorder) to [-1, 1]
+            if np.issubdtype(audio_data.dtype, np.integer):
+                audio /= -float(np.iinfo(audio_data.dtype).min)
             
-            # Delete temp file
-            os.unlink(temp_filename)
+            # Whisper expects 16kHz audio, resample anything else
+            if sample_rate != whisper.audio.SAMPLE_RATE:
+                audio = resample_poly(audio, whisper.audio.SAMPLE_RATE, sample_rate).astype(np.float32)
             
-            transcribed_text = result.get("text", "").strip()
+            # Transcribe using Whisper
+            print("📝 Transcribing audio...")
+            transcribed_text = self._decode(audio).strip()
             print(f"📄 Transcribed: '{transcribed_text}'")
             
             return transcribed_text
             
         except Exception as e:
             print(f"❌ Error transcribing audio: {e}")
-            try:
-                if 'temp_filename' in locals():
-                    os.unlink(temp_filename)
-            except:
-                pass
             return None
     
     def is_model_loaded(self) -> bool: